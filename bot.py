@@ -65,6 +65,9 @@ class GeminiBot(commands.Bot):
         """Exception raised when thought signature is disabled for a model."""
         pass
 
+    # Maximum number of queued outbound messages per channel
+    SEND_QUEUE_MAXSIZE = 100
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -80,6 +83,8 @@ class GeminiBot(commands.Bot):
         # Available and recommended models (cached at startup)
         self.available_models: list[str] = []
         self.recommended_models: list[str] = []
+        # Recommended models first, then the rest, without duplicates
+        self.ordered_models: tuple[str, ...] = ()
 
         # Pending model selections: user_id -> {channel_id, models}
         self.pending_model_selections: dict[int, dict] = {}
@@ -96,6 +101,16 @@ class GeminiBot(commands.Bot):
         # Conversation history per channel
         self.conversation_history: dict[int, list] = {}
 
+        # Per-channel locks serializing Git operations on each channel repository
+        self._history_locks: dict[int, asyncio.Lock] = {}
+
+        # Outbound message queues per channel, each drained by one sender task
+        self._send_queues: dict[int, asyncio.Queue] = {}
+        self._sender_tasks: dict[int, asyncio.Task] = {}
+
+        # Shared HTTP session for auxiliary requests (created in setup_hook)
+        self.http_session: aiohttp.ClientSession | None = None
+
         # I18n manager for translations (must be initialized before HistoryManager)
         self.i18n = I18nManager()
 
@@ -150,6 +165,9 @@ class GeminiBot(commands.Bot):
 
     async def setup_hook(self):
         """Load cogs when the bot starts."""
+        self.http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=64, keepalive_timeout=300),
+        )
         await self.load_extension("cogs.commands")
 
         # Fetch and cache available models from Gemini API with retry
@@ -162,7 +180,7 @@ class GeminiBot(commands.Bot):
             for attempt in range(max_retries):
                 try:
                     await cog._fetch_models_to_cache()
-                    print(f"Loaded {len(self.available_models)} usable Gemini models ({len(self.recommended_models)} recommended)")
+                    print(f"Loaded {len(self.available_models)} Gemini models ({len(self.recommended_models)} recommended)")
                     break
                 except Exception as e:
                     if attempt < max_retries - 1:
@@ -172,11 +190,8 @@ class GeminiBot(commands.Bot):
                     else:
                         print(f"ERROR: Failed to cache models after {max_retries} attempts")
                         print(f"Error details: {type(e).__name__}: {e}")
-                        self.recommended_models = [
-                            "gemini-flash-latest",
-                            "gemini-3-pro-preview"
-                        ]
-                        self.available_models = self.recommended_models
+                        fallback_models = ["gemini-flash-latest", "gemini-3-pro-preview"]
+                        self.set_available_models(fallback_models, fallback_models)
                         print(f"Fallback: Using {len(self.available_models)} recommended models only")
 
         # Load existing conversation histories from disk
@@ -200,6 +215,19 @@ class GeminiBot(commands.Bot):
             await self.tree.sync()
             print("Slash commands synced globally.")
 
+    async def close(self):
+        """Shut down the message senders, OAuth callback server and HTTP session before closing the bot."""
+        for task in self._sender_tasks.values():
+            task.cancel()
+        await asyncio.gather(*self._sender_tasks.values(), return_exceptions=True)
+        self._sender_tasks.clear()
+        self._send_queues.clear()
+        if self.calendar_auth is not None:
+            await self.calendar_auth.close()
+        if self.http_session is not None:
+            await self.http_session.close()
+        await super().close()
+
     def _load_histories_from_disk(self):
         """Load all conversation histories from disk on startup."""
         saved_conversations = self.history_manager.load_all_conversations()
@@ -228,14 +256,24 @@ class GeminiBot(commands.Bot):
             self.conversation_history[channel_id] = history
         print(f"Loaded conversation history for {len(saved_conversations)} channels")
 
-    def _save_history_to_disk(self, channel_id: int):
-        """Save conversation history for a channel to disk."""
-        if channel_id not in self.conversation_history:
-            return
+    def _save_history_to_disk(
+        self, channel_id: int, history: list | None = None, model: str | None = None
+    ):
+        """Save conversation history for a channel to disk.
+
+        Args:
+            channel_id: Discord channel ID.
+            history: History snapshot to save (defaults to the in-memory history).
+            model: Channel model to record (defaults to the configured model).
+        """
+        if history is None:
+            if channel_id not in self.conversation_history:
+                return
+            history = self.conversation_history[channel_id]
+        if model is None:
+            model = self.get_model(channel_id)
 
-        history = self.conversation_history[channel_id]
         messages = self.history_manager.convert_to_serializable(history, channel_id)
-        model = self.get_model(channel_id)
         self.history_manager.save_conversation(
             channel_id=channel_id,
             messages=messages,
@@ -243,14 +281,52 @@ class GeminiBot(commands.Bot):
             auto_commit=True,
         )
 
-    def _reload_history_from_disk(self, channel_id: int):
-        """Reload conversation history for a channel from disk.
+    async def _save_history_to_disk_async(self, channel_id: int) -> None:
+        """Save conversation history for a channel without blocking the event loop.
 
-        Used after branch switch to sync memory with the new branch's state.
+        A snapshot of the in-memory history is written (and committed) in a
+        worker thread. Saves for the same channel are serialized so that Git
+        operations on the channel repository never overlap. The model is
+        looked up here on the loop, since the shared config file it comes
+        from is rewritten from the loop.
+
+        Args:
+            channel_id: Discord channel ID.
         """
+        if channel_id not in self.conversation_history:
+            return
+
+        history = list(self.conversation_history[channel_id])
+        model = self.get_model(channel_id)
+        async with self.history_lock(channel_id):
+            await asyncio.to_thread(self._save_history_to_disk, channel_id, history, model)
+
+    def history_lock(self, channel_id: int) -> asyncio.Lock:
+        """Get the lock guarding Git operations on a channel's repository.
+
+        Args:
+            channel_id: Discord channel ID.
+
+        Returns:
+            The channel's lock, created on first use.
+        """
+        return self._history_locks.setdefault(channel_id, asyncio.Lock())
+
+    def _load_history_from_disk(self, channel_id: int) -> list:
+        """Read a channel's conversation history from disk.
+
+        Only reads the channel repository, so it is safe to run in a worker
+        thread.
+
+        Args:
+            channel_id: Discord channel ID.
+
+        Returns:
+            List of Content objects (empty if nothing is saved).
+        """
+        history = []
         data = self.history_manager.load_conversation(channel_id)
         if data and "messages" in data:
-            history = []
             for msg in data["messages"]:
                 parts = []
 
@@ -270,13 +346,32 @@ class GeminiBot(commands.Bot):
                 parts.append(types.Part.from_text(text=msg["content"]))
 
                 history.append(types.Content(role=msg["role"], parts=parts))
-            self.conversation_history[channel_id] = history
-        else:
-            self.conversation_history[channel_id] = []
+        return history
+
+    def _reload_history_from_disk(self, channel_id: int):
+        """Reload conversation history for a channel from disk.
+
+        Used after branch switch to sync memory with the new branch's state.
+        """
+        self.conversation_history[channel_id] = self._load_history_from_disk(channel_id)
 
         # Clear thought signature on history reload since history changed
         self.history_manager.clear_thought_signature(channel_id)
 
+    async def _reload_history_from_disk_async(self, channel_id: int) -> None:
+        """Reload conversation history for a channel without blocking the event loop.
+
+        The conversation and its images are read in a worker thread; the
+        thought signature is cleared back on the loop because it lives in the
+        shared global config file.
+
+        Args:
+            channel_id: Discord channel ID.
+        """
+        history = await asyncio.to_thread(self._load_history_from_disk, channel_id)
+        self.conversation_history[channel_id] = history
+        self.history_manager.clear_thought_signature(channel_id)
+
     def get_model(self, channel_id: int) -> str:
         """Get the model for a specific channel.
 
@@ -288,6 +383,17 @@ class GeminiBot(commands.Bot):
         """
         return self.history_manager.load_model(channel_id, self.default_model)
 
+    def set_available_models(self, recommended: list[str], available: list[str]) -> None:
+        """Replace the cached model lists.
+
+        Args:
+            recommended: Recommended models, shown first.
+            available: All usable models.
+        """
+        self.recommended_models = recommended
+        self.available_models = available
+        self.ordered_models = tuple(dict.fromkeys(recommended + available))
+
     def set_model(self, channel_id: int, model: str) -> None:
         """Set the model for a specific channel.
 
@@ -297,7 +403,100 @@ class GeminiBot(commands.Bot):
         """
         self.history_manager.save_model(channel_id, model)
 
-    async def _send_text(self, channel, text: str) -> None:
+    async def _queue_send(
+        self,
+        channel,
+        content: str | None = None,
+        file: discord.File | None = None,
+    ) -> asyncio.Future:
+        """Queue a message for the channel's background sender.
+
+        Messages for a channel are delivered in the order they were queued.
+        Only waits when the channel's queue is full.
+
+        Args:
+            channel: Discord channel to send to.
+            content: Text content (optional).
+            file: File attachment (optional).
+
+        Returns:
+            Future resolved with the sent message, or failed with the send error.
+        """
+        queue = self._send_queues.get(channel.id)
+        if queue is None:
+            queue = asyncio.Queue(maxsize=self.SEND_QUEUE_MAXSIZE)
+            self._send_queues[channel.id] = queue
+            self._sender_tasks[channel.id] = asyncio.create_task(
+                self._sender(channel, queue)
+            )
+
+        kwargs = {"file": file} if file else {}
+        future = asyncio.get_running_loop().create_future()
+        await queue.put((content, kwargs, future))
+        return future
+
+    async def _enqueue_send(
+        self,
+        channel,
+        content: str | None = None,
+        file: discord.File | None = None,
+    ) -> discord.Message:
+        """Send a message through the channel's queue and wait for delivery.
+
+        Args:
+            channel: Discord channel to send to.
+            content: Text content (optional).
+            file: File attachment (optional).
+
+        Returns:
+            The sent message.
+
+        Raises:
+            discord.HTTPException: If sending the message failed.
+        """
+        return await (await self._queue_send(channel, content, file))
+
+    @staticmethod
+    async def _wait_for_sends(channel, pending: list[asyncio.Future]) -> None:
+        """Wait for queued messages to be delivered.
+
+        A failed message (e.g. a rejected attachment) is logged and the rest
+        of the reply is still delivered.
+
+        Args:
+            channel: Discord channel the messages were queued for.
+            pending: Futures returned by _queue_send.
+        """
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"Failed to send message to channel {channel.id}: {result}")
+
+    async def _sender(self, channel, queue: asyncio.Queue) -> None:
+        """Drain a channel's outbound queue, sending messages one by one.
+
+        Args:
+            channel: Discord channel to send to.
+            queue: Queue of (content, kwargs, future) tuples for the channel.
+        """
+        while True:
+            content, kwargs, future = await queue.get()
+            try:
+                message = await channel.send(content, **kwargs)
+            except asyncio.CancelledError:
+                # Shutting down; don't leave the caller waiting on this message
+                future.cancel()
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(message)
+            finally:
+                queue.task_done()
+
+    async def _send_text(self, channel, text: str, pending: list[asyncio.Future]) -> None:
         """Send text to a channel, splitting intelligently.
         
         Ensures code blocks are sent as separate messages and not split mid-block
@@ -306,6 +505,7 @@ class GeminiBot(commands.Bot):
         Args:
             channel: Discord channel to send to.
             text: Text to send.
+            pending: List collecting the futures of the queued messages.
         """
         text = text.strip()
         if not text:
@@ -322,7 +522,7 @@ class GeminiBot(commands.Bot):
             if segment.startswith("```") and segment.endswith("```"):
                 # -- CODE BLOCK --
                 if len(segment) <= 2000:
-                    await channel.send(segment)
+                    pending.append(await self._queue_send(channel, segment))
                 else:
                     # Handle massive code blocks > 2000 chars
                     # We must split, but try to preserve code block formatting for each chunk
@@ -346,14 +546,14 @@ class GeminiBot(commands.Bot):
                         chunk_content = content[i : i + chunk_size]
                         # Reconstruct code block for this chunk
                         chunk_msg = f"```{lang}\n{chunk_content}```"
-                        await channel.send(chunk_msg)
+                        pending.append(await self._queue_send(channel, chunk_msg))
 
             else:
                 # -- REGULAR TEXT --
                 # Split into 2000 character chunks
                 # We can be smarter here too: split by newlines if possible
                 if len(segment) <= 2000:
-                    await channel.send(segment)
+                    pending.append(await self._queue_send(channel, segment))
                 else:
                     current_chunk = ""
                     lines = segment.split("\n")
@@ -361,13 +561,13 @@ class GeminiBot(commands.Bot):
                         # +1 for the newline we'll add back
                         if len(current_chunk) + len(line) + 1 > 2000:
                             if current_chunk:
-                                await channel.send(current_chunk)
+                                pending.append(await self._queue_send(channel, current_chunk))
                                 current_chunk = ""
                             
                             # If a single line is massive, we still have to hard split it
                             if len(line) > 2000:
                                 for i in range(0, len(line), 2000):
-                                    await channel.send(line[i:i+2000])
+                                    pending.append(await self._queue_send(channel, line[i:i+2000]))
                             else:
                                 current_chunk = line
                         else:
@@ -377,7 +577,7 @@ class GeminiBot(commands.Bot):
                                 current_chunk = line
                     
                     if current_chunk:
-                        await channel.send(current_chunk)
+                        pending.append(await self._queue_send(channel, current_chunk))
 
     def _format_tables(self, text: str) -> str:
         """Wrap Markdown tables in code blocks for better Discord display.
@@ -471,16 +671,21 @@ class GeminiBot(commands.Bot):
         """
         # Handle empty response
         if not response_text:
-            await channel.send("No response from Gemini.")
+            await self._enqueue_send(channel, "No response from Gemini.")
             return
 
         # Check for formulas or tables
         has_formulas = self.latex_renderer.enabled and self.latex_renderer.has_latex(response_text)
         has_tables = self.table_renderer.enabled and self.table_renderer.has_tables(response_text)
 
+        # Queued messages are awaited together at the end, so rendering the
+        # next segment overlaps with sending the previous ones
+        pending: list[asyncio.Future] = []
+
         # If neither, send as plain text with table formatting fallback
         if not has_formulas and not has_tables:
-            await self._send_text(channel, response_text)
+            await self._send_text(channel, response_text, pending)
+            await self._wait_for_sends(channel, pending)
             return
 
         # Split text by tables first (tables contain priority)
@@ -505,7 +710,7 @@ class GeminiBot(commands.Bot):
                         else:
                             # Send accumulated text + formula
                             text_to_send = text_buffer + formula_segment["original"]
-                            await self._send_text(channel, text_to_send)
+                            await self._send_text(channel, text_to_send, pending)
                             text_buffer = ""
 
                             # Render and send formula as image
@@ -514,14 +719,11 @@ class GeminiBot(commands.Bot):
                                 language=self.i18n.language,
                             )
                             if image_data:
-                                try:
-                                    file = discord.File(
-                                        io.BytesIO(image_data),
-                                        filename="formula.png",
-                                    )
-                                    await channel.send(file=file)
-                                except Exception as e:
-                                    print(f"Failed to send LaTeX image: {e}")
+                                file = discord.File(
+                                    io.BytesIO(image_data),
+                                    filename="formula.png",
+                                )
+                                pending.append(await self._queue_send(channel, file=file))
                 else:
                     # No formulas, just accumulate text
                     text_buffer += segment["content"]
@@ -529,7 +731,7 @@ class GeminiBot(commands.Bot):
             else:  # table segment
                 # Send accumulated text first
                 if text_buffer.strip():
-                    await self._send_text(channel, text_buffer)
+                    await self._send_text(channel, text_buffer, pending)
                     text_buffer = ""
 
                 # Try to render table as image
@@ -542,22 +744,21 @@ class GeminiBot(commands.Bot):
                 )
 
                 if image_data:
-                    try:
-                        file = discord.File(
-                            io.BytesIO(image_data),
-                            filename="table.png",
-                        )
-                        await channel.send(file=file)
-                    except Exception as e:
-                        print(f"Failed to send table image: {e}")
+                    file = discord.File(
+                        io.BytesIO(image_data),
+                        filename="table.png",
+                    )
+                    pending.append(await self._queue_send(channel, file=file))
                 else:
                     # Fallback to code block formatting
                     fallback_table = self._format_tables(segment["original"])
-                    await self._send_text(channel, fallback_table)
+                    await self._send_text(channel, fallback_table, pending)
 
         # Send any remaining text
         if text_buffer.strip():
-            await self._send_text(channel, text_buffer)
+            await self._send_text(channel, text_buffer, pending)
+
+        await self._wait_for_sends(channel, pending)
 
     def _extract_thought_signature(self, response) -> bytes | None:
         """Extract thought_signature from Gemini response.
@@ -576,8 +777,8 @@ class GeminiBot(commands.Bot):
             return None
 
         for part in candidate.content.parts:
-            if hasattr(part, "thought_signature") and part.thought_signature:
-                return part.thought_signature
+            if thought_signature := getattr(part, "thought_signature", None):
+                return thought_signature
         return None
 
     # =========================================================================
@@ -725,19 +926,18 @@ class GeminiBot(commands.Bot):
                 seen_uris.add(uri)
                 unique_sources.append(source)
 
-        # Resolve vertexaisearch URLs
-        async with aiohttp.ClientSession() as session:
-            for source in unique_sources:
-                uri = source.get("uri")
-                if uri and "vertexaisearch.cloud.google.com" in uri:
-                    try:
-                        async with session.head(
-                            uri, allow_redirects=True, timeout=aiohttp.ClientTimeout(total=5)
-                        ) as resp:
-                            source["uri"] = str(resp.url)
-                    except Exception:
-                        # Fallback to original URI if resolution fails
-                        pass
+        # Resolve vertexaisearch URLs over the shared keep-alive session
+        for source in unique_sources:
+            uri = source.get("uri")
+            if uri and "vertexaisearch.cloud.google.com" in uri:
+                try:
+                    async with self.http_session.head(
+                        uri, allow_redirects=True, timeout=aiohttp.ClientTimeout(total=5)
+                    ) as resp:
+                        source["uri"] = str(resp.url)
+                except Exception:
+                    # Fallback to original URI if resolution fails
+                    pass
 
         return unique_sources
 
@@ -889,8 +1089,8 @@ class GeminiBot(commands.Bot):
                 )
             )
 
-            # Save to disk with Git commit
-            self._save_history_to_disk(channel_id)
+            # Save to disk with Git commit (off the event loop)
+            await self._save_history_to_disk_async(channel_id)
 
             return response_text
         except Exception as e:
@@ -939,9 +1139,9 @@ class GeminiBot(commands.Bot):
 
         # Collect function calls
         return [
-            part.function_call
+            function_call
             for part in candidate.content.parts
-            if hasattr(part, "function_call") and part.function_call
+            if (function_call := getattr(part, "function_call", None))
         ]
 
     async def _execute_function_calls(
@@ -958,13 +1158,31 @@ class GeminiBot(commands.Bot):
         Returns:
             List of function response Part objects.
         """
-        responses = []
-        for fc in function_calls:
-            result = await self._execute_single_function(fc, user_id)
-            responses.append(
-                types.Part.from_function_response(name=fc.name, response=result)
+        # Calendar-only turns go to the handler together so event changes
+        # can share one batch request
+        if (
+            len(function_calls) > 1
+            and self.calendar_tool_handler
+            and user_id
+            and all(fc.name in self._CALENDAR_FUNCTIONS for fc in function_calls)
+        ):
+            results = await self.calendar_tool_handler.handle_function_calls(
+                [(fc.name, dict(fc.args) if fc.args else {}) for fc in function_calls],
+                user_id,
             )
-        return responses
+            return [
+                types.Part.from_function_response(name=fc.name, response=result)
+                for fc, result in zip(function_calls, results)
+            ]
+
+        # Calls from one turn are independent, so overlap their API round trips
+        results = await asyncio.gather(
+            *(self._execute_single_function(fc, user_id) for fc in function_calls)
+        )
+        return [
+            types.Part.from_function_response(name=fc.name, response=result)
+            for fc, result in zip(function_calls, results)
+        ]
 
     async def _execute_single_function(
         self,
@@ -1139,7 +1357,7 @@ async def on_ready():
 async def on_command_error(ctx, error):
     """Handle command errors."""
     if isinstance(error, commands.CommandNotFound):
-        await ctx.send(bot.i18n.t("command_not_found", command=ctx.invoked_with))
+        await bot._enqueue_send(ctx.channel, bot.i18n.t("command_not_found", command=ctx.invoked_with))
     else:
         # Re-raise other errors to see them in console
         raise error
@@ -1165,12 +1383,13 @@ async def _handle_instruction_upload(message) -> bool:
                 content = await attachment.read()
                 text = content.decode("utf-8")
                 channel_id = message.channel.id
-                bot.history_manager.save_system_prompt(channel_id, text)
-                await message.channel.send(bot.i18n.t("prompt_updated_from_file"))
+                async with bot.history_lock(channel_id):
+                    await asyncio.to_thread(bot.history_manager.save_system_prompt, channel_id, text)
+                await bot._enqueue_send(message.channel, bot.i18n.t("prompt_updated_from_file"))
             except UnicodeDecodeError:
-                await message.channel.send(bot.i18n.t("prompt_file_decode_error"))
+                await bot._enqueue_send(message.channel, bot.i18n.t("prompt_file_decode_error"))
             except Exception as e:
-                await message.channel.send(bot.i18n.t("prompt_error", error=str(e)))
+                await bot._enqueue_send(message.channel, bot.i18n.t("prompt_error", error=str(e)))
             return True
     return False
 
@@ -1190,11 +1409,11 @@ async def _handle_master_instruction_upload(message) -> bool:
                 content = await attachment.read()
                 text = content.decode("utf-8")
                 bot.history_manager.save_master_prompt(text)
-                await message.channel.send(bot.i18n.t("master_prompt_updated"))
+                await bot._enqueue_send(message.channel, bot.i18n.t("master_prompt_updated"))
             except UnicodeDecodeError:
-                await message.channel.send(bot.i18n.t("master_prompt_decode_error"))
+                await bot._enqueue_send(message.channel, bot.i18n.t("master_prompt_decode_error"))
             except Exception as e:
-                await message.channel.send(bot.i18n.t("prompt_error", error=str(e)))
+                await bot._enqueue_send(message.channel, bot.i18n.t("prompt_error", error=str(e)))
             return True
     return False
 
@@ -1217,7 +1436,7 @@ async def _handle_branch_selection(message) -> bool:
     # Handle cancel
     if content == "cancel":
         del bot.pending_branch_selections[user_id]
-        await message.channel.send(bot.i18n.t("branch_select_cancelled"))
+        await bot._enqueue_send(message.channel, bot.i18n.t("branch_select_cancelled"))
         return True
 
     # Handle number selection
@@ -1235,13 +1454,15 @@ async def _handle_branch_selection(message) -> bool:
                     bot.history_manager.switch_branch(channel_id, selected_branch)
                     # Reload history from disk
                     bot._reload_history_from_disk(channel_id)
-                    await message.channel.send(
+                    await bot._enqueue_send(
+                        message.channel,
                         bot.i18n.t("branch_switched", branch=selected_branch)
                     )
 
                 elif action == "delete":
                     bot.history_manager.delete_branch(channel_id, selected_branch)
-                    await message.channel.send(
+                    await bot._enqueue_send(
+                        message.channel,
                         bot.i18n.t("branch_deleted", branch=selected_branch)
                     )
 
@@ -1256,24 +1477,26 @@ async def _handle_branch_selection(message) -> bool:
                     bot._reload_history_from_disk(channel_id)
 
                     if merged_count > 0:
-                        await message.channel.send(
+                        await bot._enqueue_send(
+                            message.channel,
                             bot.i18n.t("branch_merged", branch=selected_branch, count=merged_count)
                         )
                     else:
-                        await message.channel.send(bot.i18n.t("branch_merge_nothing"))
+                        await bot._enqueue_send(message.channel, bot.i18n.t("branch_merge_nothing"))
 
                 del bot.pending_branch_selections[user_id]
                 
             except Exception as e:
-                await message.channel.send(bot.i18n.t("branch_error", error=e))
+                await bot._enqueue_send(message.channel, bot.i18n.t("branch_error", error=e))
         else:
-            await message.channel.send(
+            await bot._enqueue_send(
+                message.channel,
                 bot.i18n.t("branch_select_invalid_number", max=len(branches))
             )
         return True
 
     # Invalid input - prompt again
-    await message.channel.send(bot.i18n.t("branch_select_prompt"))
+    await bot._enqueue_send(message.channel, bot.i18n.t("branch_select_prompt"))
     return True
 
 
@@ -1295,7 +1518,7 @@ async def _handle_tool_mode_selection(message) -> bool:
     # Handle cancel
     if content == "cancel":
         del bot.pending_tool_mode_selections[user_id]
-        await message.channel.send(bot.i18n.t("mode_select_cancelled"))
+        await bot._enqueue_send(message.channel, bot.i18n.t("mode_select_cancelled"))
         return True
 
     # Handle number selection
@@ -1311,23 +1534,25 @@ async def _handle_tool_mode_selection(message) -> bool:
             if selected_mode in ("calendar", "todo"):
                 if not bot.calendar_auth or not bot.calendar_auth.is_user_authenticated(user_id):
                     key = f"mode_{selected_mode}_not_linked"
-                    await message.channel.send(bot.i18n.t(key))
+                    await bot._enqueue_send(message.channel, bot.i18n.t(key))
                     del bot.pending_tool_mode_selections[user_id]
                     return True
 
             bot.set_tool_mode(channel_id, selected_mode)
             del bot.pending_tool_mode_selections[user_id]
-            await message.channel.send(
+            await bot._enqueue_send(
+                message.channel,
                 bot.i18n.t("mode_changed", mode=selected_mode)
             )
         else:
-            await message.channel.send(
+            await bot._enqueue_send(
+                message.channel,
                 bot.i18n.t("mode_select_invalid_number", max=len(modes))
             )
         return True
 
     # Invalid input - prompt again
-    await message.channel.send(bot.i18n.t("mode_select_prompt"))
+    await bot._enqueue_send(message.channel, bot.i18n.t("mode_select_prompt"))
     return True
 
 
@@ -1349,7 +1574,7 @@ async def _handle_model_selection(message) -> bool:
     # Handle cancel
     if content == "cancel":
         del bot.pending_model_selections[user_id]
-        await message.channel.send(bot.i18n.t("model_select_cancelled"))
+        await bot._enqueue_send(message.channel, bot.i18n.t("model_select_cancelled"))
         return True
 
     # Handle number selection
@@ -1362,17 +1587,19 @@ async def _handle_model_selection(message) -> bool:
             selected_model = model_names[index]
             bot.set_model(channel_id, selected_model)
             del bot.pending_model_selections[user_id]
-            await message.channel.send(
+            await bot._enqueue_send(
+                message.channel,
                 bot.i18n.t("model_select_changed", model=selected_model)
             )
         else:
-            await message.channel.send(
+            await bot._enqueue_send(
+                message.channel,
                 bot.i18n.t("model_select_invalid_number", max=len(model_names))
             )
         return True
 
     # Invalid input - prompt again
-    await message.channel.send(bot.i18n.t("model_select_prompt"))
+    await bot._enqueue_send(message.channel, bot.i18n.t("model_select_prompt"))
     return True
 
 
@@ -1409,13 +1636,14 @@ async def _handle_delete_confirmation(message) -> bool:
                 history.pop(idx)
 
         # Save updated history
-        bot._save_history_to_disk(channel_id)
+        await bot._save_history_to_disk_async(channel_id)
 
-        await message.channel.send(
+        await bot._enqueue_send(
+            message.channel,
             bot.i18n.t("history_delete_success", count=len(pending["indices"]))
         )
     else:
-        await message.channel.send(bot.i18n.t("history_delete_cancelled"))
+        await bot._enqueue_send(message.channel, bot.i18n.t("history_delete_cancelled"))
 
     return True
 
@@ -1457,7 +1685,7 @@ async def _handle_auto_response(message) -> None:
 
             await bot.send_response(message.channel, display_text)
         except Exception as e:
-            await message.channel.send(f"An error occurred: {e}")
+            await bot._enqueue_send(message.channel, f"An error occurred: {e}")
 
 
 @bot.event
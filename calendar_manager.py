@@ -5,20 +5,30 @@ including token management, the authorization flow, and calendar operations.
 """
 
 import asyncio
+import functools
+import html
 import json
 import os
+import random
 import secrets
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http import HTTPStatus
 from pathlib import Path
-from urllib.parse import parse_qs, urlparse
+from typing import Any
+from urllib.parse import unquote
 
+import httplib2
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import Flow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+from google_auth_httplib2 import AuthorizedHttp
 
 # OAuth 2.0 scopes for Google Calendar and Tasks
 SCOPES = [
@@ -35,58 +45,351 @@ DEFAULT_TOKENS_DIR = "history/tokens"
 # OAuth callback timeout in seconds
 OAUTH_CALLBACK_TIMEOUT = 300
 
+# Static OAuth callback pages, pre-encoded; the failure page wraps an escaped message
+_SUCCESS_HTML = (
+    b"<html><body>"
+    b"<h1>Authorization received!</h1>"
+    b"<p>You can close this window and return to Discord.</p>"
+    b"</body></html>"
+)
+_INVALID_HTML = b"<html><body><h1>Invalid request</h1></body></html>"
+_FAILED_HTML_PREFIX = b"<html><body><h1>Authentication failed: "
+_FAILED_HTML_SUFFIX = b"</h1><p>You can close this window.</p></body></html>"
+
+# Refresh access tokens this close to expiry before making API calls
+TOKEN_REFRESH_SKEW = timedelta(seconds=60)
+
+# Partial response for list_events: only the fields it uses
+LIST_EVENTS_FIELDS = (
+    "nextPageToken,items(id,summary,description,location,htmlLink,"
+    "start/dateTime,start/date,end/dateTime,end/date)"
+)
+
+# Partial response for created/updated events: the fields _simplify_event uses
+EVENT_RESULT_FIELDS = "id,summary,htmlLink,start,end"
+
+# Google API batch requests accept at most 50 calls
+MAX_BATCH_SIZE = 50
+
+# Maximum number of parsed user credentials kept in memory
+CREDENTIALS_CACHE_SIZE = 1024
+
+# Seconds an is_user_authenticated() answer is reused without touching disk
+AUTH_STATUS_TTL = 30
+
+# Seconds a list_events result is reused, and how many results are kept
+EVENTS_CACHE_TTL = 30
+EVENTS_CACHE_SIZE = 256
+
+# Dedicated pool for blocking Google API calls, sized for API concurrency
+# rather than sharing the event loop's default executor
+API_MAX_WORKERS = 8
+_executor = ThreadPoolExecutor(max_workers=API_MAX_WORKERS, thread_name_prefix="google-api")
+
+# Retries for rate-limited or failed API requests (backoff capped in seconds)
+API_MAX_RETRIES = 5
+API_MAX_BACKOFF = 32
+RETRYABLE_403_REASONS = frozenset({"rateLimitExceeded", "userRateLimitExceeded"})
+
+# HTTP methods safe to resend after a 5xx; a failed insert may still have
+# been applied, so repeating it could create duplicates
+IDEMPOTENT_METHODS = frozenset({"GET", "DELETE", "PUT", "PATCH"})
+
+
+# Per-thread httplib2.Http, so each executor thread keeps its own
+# keep-alive connections to Google
+_thread_local = threading.local()
+
+
+class _ThreadLocalAuthorizedHttp:
+    """Authorized HTTP transport that uses the calling thread's connections.
+
+    httplib2.Http is not thread-safe, so it can't be shared by the executor
+    threads; a fresh one per request would pay a TCP+TLS handshake every
+    time. Instead each thread lazily creates one Http and reuses it for all
+    requests it executes, whichever user's credentials they carry.
+    """
+
+    def __init__(self, credentials: Credentials):
+        """Initialize the transport.
+
+        Args:
+            credentials: Credentials to authorize requests with.
+        """
+        self.credentials = credentials
+
+    def request(self, *args, **kwargs):
+        """Send an authorized request over this thread's connections."""
+        http = getattr(_thread_local, "http", None)
+        if http is None:
+            http = _thread_local.http = httplib2.Http()
+        return AuthorizedHttp(self.credentials, http=http).request(*args, **kwargs)
+
+    def close(self) -> None:
+        """Nothing to close; connections belong to the executor threads."""
+
+
+def _build_request(http, *args, **kwargs) -> HttpRequest:
+    """Build an API request bound to a thread-local HTTP transport.
+
+    Args:
+        http: The service's authorized HTTP object (provides credentials).
+        *args: Positional arguments for HttpRequest.
+        **kwargs: Keyword arguments for HttpRequest.
+
+    Returns:
+        HttpRequest using _ThreadLocalAuthorizedHttp.
+    """
+    return HttpRequest(_ThreadLocalAuthorizedHttp(http.credentials), *args, **kwargs)
+
+
+def _event_time(node: dict | None) -> str | None:
+    """Get the dateTime (timed event) or date (all-day event) of a start/end node.
+
+    Args:
+        node: The event's "start" or "end" object, if present.
+
+    Returns:
+        ISO 8601 date-time or date string, or None.
+    """
+    if not node:
+        return None
+    return node.get("dateTime") or node.get("date")
+
+
+def _event_fields(
+    summary: str | None = None,
+    start_time: str | None = None,
+    end_time: str | None = None,
+    description: str | None = None,
+    location: str | None = None,
+    patch: bool = False,
+) -> dict:
+    """Build the event resource fields for the given values.
+
+    Fields whose value is None are left out, so the result works both as a
+    new event body and as a partial update.
+
+    Args:
+        summary: Event title.
+        start_time: Start time in ISO 8601 format.
+        end_time: End time in ISO 8601 format.
+        description: Event description.
+        location: Event location.
+        patch: Whether the fields are sent with events.patch. Patch merges
+            start/end into the existing values, so the keys of the other
+            (timed or all-day) form are explicitly cleared.
+
+    Returns:
+        Event resource fields.
+    """
+    fields = {}
+    if summary is not None:
+        fields["summary"] = summary
+    if description is not None:
+        fields["description"] = description
+    if location is not None:
+        fields["location"] = location
+    # All-day events use 'date', timed events use 'dateTime'
+    for key, value in (("start", start_time), ("end", end_time)):
+        if value is None:
+            continue
+        if "T" in value:
+            fields[key] = {"dateTime": value, "timeZone": "Asia/Tokyo"}
+            if patch:
+                fields[key]["date"] = None
+        else:
+            fields[key] = {"date": value}
+            if patch:
+                fields[key].update(dateTime=None, timeZone=None)
+    return fields
+
+
+def _simplify_event(event: dict) -> dict:
+    """Convert a created/updated event resource to the simplified format.
+
+    Args:
+        event: Event resource returned by the Calendar API.
+
+    Returns:
+        Dict with id, summary, start, end and html_link.
+    """
+    return {
+        "id": event.get("id"),
+        "summary": event.get("summary"),
+        "start": _event_time(event.get("start")),
+        "end": _event_time(event.get("end")),
+        "html_link": event.get("htmlLink"),
+    }
+
+
+def is_rate_limit_error(error: HttpError) -> bool:
+    """Check whether an API error is a rate limit response.
+
+    Args:
+        error: Error raised by a Google API request.
+
+    Returns:
+        True for 429 and rate-limit 403 responses.
+    """
+    status = error.resp.status
+    if status == 429:
+        return True
+    if status != 403:
+        return False
+    # Other 403s (e.g. forbidden, daily quota used up) won't succeed on retry
+    details = error.error_details if isinstance(error.error_details, list) else []
+    return any(
+        isinstance(detail, dict) and detail.get("reason") in RETRYABLE_403_REASONS
+        for detail in details
+    )
+
+
+def _is_retryable(error: HttpError, request) -> bool:
+    """Check whether a failed API request can safely be sent again.
+
+    Args:
+        error: Error raised by the request.
+        request: The HttpRequest or BatchHttpRequest that failed.
+
+    Returns:
+        True for 429 and rate-limit 403 responses, and for 5xx responses to
+        idempotent requests. Batches are never retried on 5xx, since some of
+        their operations may already have been applied.
+    """
+    if is_rate_limit_error(error):
+        return True
+    return error.resp.status >= 500 and getattr(request, "method", None) in IDEMPOTENT_METHODS
+
+
+async def _execute(request) -> Any:
+    """Execute a Google API request without blocking the event loop.
+
+    Rate limit errors, and server errors on idempotent requests, are
+    retried with truncated exponential backoff and jitter, waiting on the
+    event loop rather than holding an executor thread.
+
+    Args:
+        request: HttpRequest or BatchHttpRequest to execute.
+
+    Returns:
+        The request's response.
+
+    Raises:
+        HttpError: If the request fails permanently or runs out of retries.
+    """
+    loop = asyncio.get_running_loop()
+    for attempt in range(API_MAX_RETRIES + 1):
+        try:
+            return await loop.run_in_executor(_executor, request.execute)
+        except HttpError as e:
+            if attempt == API_MAX_RETRIES or not _is_retryable(e, request):
+                raise
+        await asyncio.sleep(min(2 ** attempt + random.random(), API_MAX_BACKOFF))
+
 
 # =============================================================================
 # OAuth Callback Handler
 # =============================================================================
 
 
-class OAuthCallbackHandler(BaseHTTPRequestHandler):
-    """HTTP request handler for OAuth 2.0 callback.
+class OAuthCallbackHandler:
+    """Asyncio connection handler for the OAuth 2.0 callback.
 
     Handles the redirect from Google's OAuth server after user authorization.
-    Designed to be used with CalendarAuthManager for credential management.
+    Designed to be used with CalendarAuthManager for credential management;
+    instances are passed to asyncio.start_server as the client callback.
     """
 
-    # Class-level reference to auth manager (set before server starts)
-    auth_manager = None
+    # Maximum time to wait for a client to send its request headers
+    REQUEST_TIMEOUT = 10
 
-    def log_message(self, format, *args):
-        """Suppress HTTP server logging."""
-        pass
+    def __init__(self, auth_manager: "CalendarAuthManager"):
+        """Initialize the handler.
 
-    def do_GET(self):
-        """Handle GET request for OAuth callback."""
-        parsed = urlparse(self.path)
+        Args:
+            auth_manager: CalendarAuthManager holding the pending auth flows.
+        """
+        self.auth_manager = auth_manager
+
+    async def __call__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Handle a single HTTP connection.
+
+        Args:
+            reader: Stream reader for the client connection.
+            writer: Stream writer for the client connection.
+        """
+        try:
+            request = await asyncio.wait_for(
+                reader.readuntil(b"\r\n\r\n"), timeout=self.REQUEST_TIMEOUT
+            )
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, TimeoutError):
+            writer.close()
+            return
+
+        try:
+            # Request line: "GET /callback?state=...&code=... HTTP/1.1"
+            request_line = request.split(b"\r\n", 1)[0].decode("latin-1")
+            parts = request_line.split(" ")
+            if len(parts) == 3 and parts[0] == "GET":
+                await self.do_GET(parts[1], writer)
+            else:
+                self._send_not_found(writer)
+            await writer.drain()
+        except ConnectionError:
+            pass  # Browser went away; nothing to respond to
+        finally:
+            writer.close()
 
+    async def do_GET(self, path: str, writer: asyncio.StreamWriter) -> None:
+        """Handle GET request for OAuth callback.
+
+        Args:
+            path: Request target (path and query string).
+            writer: Stream writer for the client connection.
+        """
         # Only handle /callback path
-        if parsed.path != "/callback":
-            self._send_not_found()
+        route, _, query = path.partition("?")
+        if route != "/callback":
+            self._send_not_found(writer)
             return
 
-        # Parse query parameters
-        params = parse_qs(parsed.query)
-        received_state = params.get("state", [None])[0]
-        code = params.get("code", [None])[0]
-        error = params.get("error", [None])[0]
+        # The query has a fixed shape (state, code or error), so split it
+        # directly instead of going through parse_qs
+        params: dict[str, str] = {}
+        for pair in query.split("&"):
+            key, _, value = pair.partition("=")
+            params.setdefault(key, value)
+
+        # state is URL-safe base64 and never needs decoding
+        received_state = params.get("state") or None
+        code = params.get("code")
+        error = params.get("error")
+        if code:
+            code = unquote(code)
+        if error:
+            error = unquote(error)
 
         # Get pending auth info
         pending = self._get_pending_auth(received_state)
-        if not pending:
-            self._send_invalid_request()
+        if not pending or not (error or code):
+            self._send_invalid_request(writer)
             return
 
+        # The flow is finished either way; a replayed callback is invalid
+        self.auth_manager._pending_auth.pop(received_state, None)
+
         # Handle error from OAuth provider
         if error:
-            self._handle_oauth_error(error, pending)
+            self._handle_oauth_error(writer, error, pending)
             return
 
         # Handle successful authorization
-        if code:
-            self._handle_oauth_success(code, pending, received_state)
-
-        # Signal to stop server
-        self.server.should_stop = True
+        self._handle_oauth_success(writer, code, pending)
 
     def _get_pending_auth(self, state: str) -> dict | None:
         """Get pending auth info for the given state.
@@ -97,35 +400,49 @@ class OAuthCallbackHandler(BaseHTTPRequestHandler):
         Returns:
             Pending auth dictionary or None if not found.
         """
-        if not self.auth_manager:
-            return None
+        return self.auth_manager._pending_auth.get(state)
 
-        with self.auth_manager._lock:
-            return self.auth_manager._pending_auth.get(state)
+    def _send_response(
+        self,
+        writer: asyncio.StreamWriter,
+        status_code: int,
+        body: bytes = b"",
+        content_type: str | None = None,
+    ) -> None:
+        """Write an HTTP/1.1 response and mark the connection for closing.
 
-    def _send_html_response(self, status_code: int, html: str) -> None:
+        Args:
+            writer: Stream writer for the client connection.
+            status_code: HTTP status code.
+            body: Response body.
+            content_type: Content-Type header value (optional).
+        """
+        headers = [f"HTTP/1.1 {status_code} {HTTPStatus(status_code).phrase}"]
+        if content_type:
+            headers.append(f"Content-Type: {content_type}")
+        headers.append(f"Content-Length: {len(body)}")
+        headers.append("Connection: close")
+        writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body)
+
+    def _send_html_response(
+        self, writer: asyncio.StreamWriter, status_code: int, body: bytes
+    ) -> None:
         """Send an HTML response.
 
         Args:
+            writer: Stream writer for the client connection.
             status_code: HTTP status code.
-            html: HTML content to send.
+            body: Encoded HTML content to send.
         """
-        self.send_response(status_code)
-        self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.end_headers()
-        self.wfile.write(html.encode())
+        self._send_response(writer, status_code, body, "text/html; charset=utf-8")
 
-    def _send_not_found(self) -> None:
+    def _send_not_found(self, writer: asyncio.StreamWriter) -> None:
         """Send 404 Not Found response."""
-        self.send_response(404)
-        self.end_headers()
+        self._send_response(writer, 404)
 
-    def _send_invalid_request(self) -> None:
+    def _send_invalid_request(self, writer: asyncio.StreamWriter) -> None:
         """Send invalid request response."""
-        self._send_html_response(
-            400,
-            "<html><body><h1>Invalid request</h1></body></html>"
-        )
+        self._send_html_response(writer, 400, _INVALID_HTML)
 
     def _resolve_future(self, pending: dict, result=None, exception=None) -> None:
         """Resolve the pending future with result or exception.
@@ -135,67 +452,71 @@ class OAuthCallbackHandler(BaseHTTPRequestHandler):
             result: Success result (if any).
             exception: Exception to raise (if any).
         """
+        pending["timeout"].cancel()
         future = pending["future"]
-        loop = future.get_loop()
+        if future.done():
+            return
 
         if exception:
-            loop.call_soon_threadsafe(future.set_exception, exception)
+            future.set_exception(exception)
         else:
-            loop.call_soon_threadsafe(future.set_result, result)
+            future.set_result(result)
 
-    def _handle_oauth_error(self, error: str, pending: dict) -> None:
+    def _handle_oauth_error(
+        self, writer: asyncio.StreamWriter, error: str, pending: dict
+    ) -> None:
         """Handle OAuth error response.
 
         Args:
+            writer: Stream writer for the client connection.
             error: Error message from OAuth provider.
             pending: Pending auth dictionary.
         """
         self._send_html_response(
+            writer,
             200,
-            f"<html><body><h1>Authentication failed: {error}</h1>"
-            "<p>You can close this window.</p></body></html>"
+            _FAILED_HTML_PREFIX + html.escape(error).encode() + _FAILED_HTML_SUFFIX,
         )
         self._resolve_future(pending, exception=Exception(f"OAuth error: {error}"))
 
-    def _handle_oauth_success(self, code: str, pending: dict, state: str) -> None:
+    def _handle_oauth_success(
+        self, writer: asyncio.StreamWriter, code: str, pending: dict
+    ) -> None:
         """Handle successful OAuth authorization.
 
+        The browser gets its response right away; the token exchange with
+        Google runs in the background and its outcome is reported to Discord
+        through the pending future.
+
+        Args:
+            writer: Stream writer for the client connection.
+            code: Authorization code from OAuth provider.
+            pending: Pending auth dictionary.
+        """
+        self._send_html_response(writer, 200, _SUCCESS_HTML)
+
+        task = asyncio.create_task(self._exchange_code(code, pending))
+        self.auth_manager._background_tasks.add(task)
+        task.add_done_callback(self.auth_manager._background_tasks.discard)
+
+    async def _exchange_code(self, code: str, pending: dict) -> None:
+        """Exchange the authorization code for tokens and save them.
+
         Args:
             code: Authorization code from OAuth provider.
             pending: Pending auth dictionary.
-            state: OAuth state parameter.
         """
         try:
-            # Exchange code for tokens
+            # Blocking HTTPS call, run in a thread
             flow = pending["flow"]
-            flow.fetch_token(code=code)
-            creds = flow.credentials
-
-            # Save credentials
-            user_id = pending["user_id"]
-            self.auth_manager._save_credentials(user_id, creds)
-
-            self._send_html_response(
-                200,
-                "<html><body>"
-                "<h1>Authentication successful!</h1>"
-                "<p>You can close this window and return to Discord.</p>"
-                "</body></html>"
-            )
-            self._resolve_future(pending, result=True)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(_executor, functools.partial(flow.fetch_token, code=code))
 
+            self.auth_manager._save_credentials(pending["user_id"], flow.credentials)
+            self._resolve_future(pending, result=True)
         except Exception as e:
-            self._send_html_response(
-                500,
-                f"<html><body><h1>Error: {e}</h1></body></html>"
-            )
             self._resolve_future(pending, exception=e)
 
-        finally:
-            # Clean up pending auth
-            with self.auth_manager._lock:
-                self.auth_manager._pending_auth.pop(state, None)
-
 
 class CalendarAuthManager:
     """Manages OAuth 2.0 authentication for Google Calendar API."""
@@ -215,11 +536,36 @@ class CalendarAuthManager:
         self.tokens_dir = Path(tokens_dir)
         self.tokens_dir.mkdir(parents=True, exist_ok=True)
 
+        # is_user_authenticated results: user_id -> (expires_at monotonic, result)
+        self._auth_status_cache: dict[int, tuple[float, bool]] = {}
+
+        # Token file paths per user, built once
+        self._token_paths: dict[int, Path] = {}
+
         # Pending authorization flows: state -> {user_id, flow, future}
         self._pending_auth: dict[str, dict] = {}
 
-        # Lock for thread-safe operations
-        self._lock = threading.Lock()
+        # Built API services: (user_id, api) -> (id(creds), service)
+        self._service_cache: dict[tuple[int, str], tuple[int, Any]] = {}
+
+        # Long-lived OAuth callback servers shared by all flows: port -> server
+        self._callback_servers: dict[int, asyncio.Server] = {}
+
+        # Background token exchange tasks
+        self._background_tasks: set[asyncio.Task] = set()
+
+        # Cached configuration status:
+        # ((path, mtime_ns, size), status dict, parsed credentials.json or None)
+        self._config_cache: tuple[tuple[str, int, int], dict, dict | None] | None = None
+
+        # Parsed credentials per user: user_id -> (token file mtime_ns, creds).
+        # LRU-ordered.
+        self._creds_cache: OrderedDict[int, tuple[int, Credentials]] = OrderedDict()
+
+        # Recent list_events results (or in-flight fetches), LRU-ordered:
+        # (user_id, calendar_id, time_min, time_max, max_results)
+        #     -> (expires_at monotonic, task)
+        self._events_cache: OrderedDict[tuple, tuple[float, asyncio.Task]] = OrderedDict()
 
     def _get_token_path(self, user_id: int) -> Path:
         """Get the token file path for a user.
@@ -230,7 +576,10 @@ class CalendarAuthManager:
         Returns:
             Path to the user's token file.
         """
-        return self.tokens_dir / f"{user_id}.json"
+        token_path = self._token_paths.get(user_id)
+        if token_path is None:
+            token_path = self._token_paths[user_id] = self.tokens_dir / f"{user_id}.json"
+        return token_path
 
     def is_credentials_configured(self) -> bool:
         """Check if OAuth credentials file exists and is valid.
@@ -261,7 +610,9 @@ class CalendarAuthManager:
         setup_url = "https://console.cloud.google.com/apis/credentials"
 
         # Check if file exists
-        if not os.path.exists(self.credentials_file):
+        try:
+            st = os.stat(self.credentials_file)
+        except FileNotFoundError:
             return {
                 "configured": False,
                 "error_code": "file_not_found",
@@ -269,34 +620,71 @@ class CalendarAuthManager:
                 "setup_url": setup_url,
             }
 
+        # Reuse the previous result while the file is unchanged
+        cache_key = (self.credentials_file, st.st_mtime_ns, st.st_size)
+        if self._config_cache is not None and self._config_cache[0] == cache_key:
+            return dict(self._config_cache[1])
+
+        status, client_config = self._check_credentials_file(setup_url)
+        self._config_cache = (cache_key, status, client_config)
+        return dict(status)
+
+    def _get_client_config(self) -> dict:
+        """Get the parsed credentials.json contents.
+
+        Parsed once per file version and shared with get_configuration_status.
+
+        Returns:
+            Client config dict as expected by Flow.from_client_config.
+
+        Raises:
+            FileNotFoundError: If credentials.json is missing or invalid.
+        """
+        if not self.is_credentials_configured():
+            raise FileNotFoundError(
+                f"OAuth credentials file not found: {self.credentials_file}"
+            )
+        return self._config_cache[2]
+
+    def _check_credentials_file(self, setup_url: str) -> tuple[dict, dict | None]:
+        """Parse and validate credentials.json.
+
+        Args:
+            setup_url: Google Cloud Console URL included in the result.
+
+        Returns:
+            Tuple of (configuration status dict, see get_configuration_status;
+            parsed file contents, or None if the file is not usable).
+        """
         # Try to parse JSON
         try:
-            with open(self.credentials_file, "r") as f:
-                data = json.load(f)
+            data = json.loads(Path(self.credentials_file).read_bytes())
         except json.JSONDecodeError as e:
             return {
                 "configured": False,
                 "error_code": "invalid_json",
                 "message": f"Invalid JSON format: {e}",
                 "setup_url": setup_url,
-            }
+            }, None
         except Exception as e:
             return {
                 "configured": False,
                 "error_code": "read_error",
                 "message": f"Cannot read file: {e}",
                 "setup_url": setup_url,
-            }
+            }, None
 
         # Check for required structure (installed or web application)
-        client_config = data.get("installed") or data.get("web")
-        if not client_config:
+        client_config = None
+        if isinstance(data, dict):
+            client_config = data.get("installed") or data.get("web")
+        if not isinstance(client_config, dict) or not client_config:
             return {
                 "configured": False,
                 "error_code": "missing_installed",
                 "message": "Missing 'installed' or 'web' key in credentials.json",
                 "setup_url": setup_url,
-            }
+            }, None
 
         # Check for required fields
         if not client_config.get("client_id"):
@@ -305,7 +693,7 @@ class CalendarAuthManager:
                 "error_code": "missing_client_id",
                 "message": "Missing 'client_id' in credentials.json",
                 "setup_url": setup_url,
-            }
+            }, None
 
         if not client_config.get("client_secret"):
             return {
@@ -313,7 +701,7 @@ class CalendarAuthManager:
                 "error_code": "missing_client_secret",
                 "message": "Missing 'client_secret' in credentials.json",
                 "setup_url": setup_url,
-            }
+            }, None
 
         # All checks passed
         return {
@@ -321,7 +709,7 @@ class CalendarAuthManager:
             "error_code": None,
             "message": "Configured",
             "setup_url": setup_url,
-        }
+        }, data
 
     def is_user_authenticated(self, user_id: int) -> bool:
         """Check if a user has valid authentication tokens.
@@ -332,39 +720,85 @@ class CalendarAuthManager:
         Returns:
             True if the user has valid tokens.
         """
-        token_path = self._get_token_path(user_id)
-        if not token_path.exists():
-            return False
+        now = time.monotonic()
+        cached = self._auth_status_cache.get(user_id)
+        if cached and now < cached[0]:
+            return cached[1]
 
         try:
-            creds = self._load_credentials(user_id)
-            return creds is not None and creds.valid
+            creds = self._load_credentials(user_id, refresh=False)
+            authenticated = self._is_usable(creds)
         except Exception:
+            authenticated = False
+
+        self._auth_status_cache[user_id] = (now + AUTH_STATUS_TTL, authenticated)
+        return authenticated
+
+    @staticmethod
+    def _is_usable(creds: Credentials | None) -> bool:
+        """Check whether credentials are valid or can be refreshed.
+
+        Args:
+            creds: Credentials object (or None).
+
+        Returns:
+            True if the access token is valid or a refresh token is available.
+        """
+        return creds is not None and (creds.valid or bool(creds.refresh_token))
+
+    def _needs_refresh(self, creds: Credentials) -> bool:
+        """Check whether an access token should be refreshed before use.
+
+        Args:
+            creds: Credentials object.
+
+        Returns:
+            True if a refresh token is available and the access token is
+            missing or within TOKEN_REFRESH_SKEW of its expiry.
+        """
+        if not creds.refresh_token:
             return False
+        if not creds.token:
+            return True
+        if creds.expiry is None:
+            return False
+        # google-auth stores expiry as naive UTC
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return creds.expiry - now < TOKEN_REFRESH_SKEW
 
-    def _load_credentials(self, user_id: int) -> Credentials | None:
+    def _load_credentials(
+        self, user_id: int, refresh: bool = True
+    ) -> Credentials | None:
         """Load credentials for a user.
 
         Args:
             user_id: Discord user ID.
+            refresh: Whether to refresh an access token that is about to
+                expire. Status checks pass False to avoid network I/O.
 
         Returns:
             Credentials object or None if not found/invalid.
         """
         token_path = self._get_token_path(user_id)
-        if not token_path.exists():
+        try:
+            mtime_ns = token_path.stat().st_mtime_ns
+        except FileNotFoundError:
             return None
 
         try:
-            with open(token_path, "r") as f:
-                token_data = json.load(f)
+            creds = self._get_cached_credentials(user_id, mtime_ns)
+            if creds is None:
+                token_data = json.loads(token_path.read_bytes())
 
-            creds = Credentials.from_authorized_user_info(token_data, SCOPES)
+                creds = Credentials.from_authorized_user_info(token_data, SCOPES)
+                self._cache_credentials(user_id, mtime_ns, creds)
 
-            # Refresh if expired
-            if creds and creds.expired and creds.refresh_token:
+            # Refresh only when the token is actually about to expire
+            if refresh and self._needs_refresh(creds):
+                old_token = creds.token
                 creds.refresh(Request())
-                self._save_credentials(user_id, creds)
+                if creds.token != old_token:
+                    self._save_credentials(user_id, creds)
 
             return creds
         except Exception:
@@ -386,8 +820,49 @@ class CalendarAuthManager:
             "client_secret": creds.client_secret,
             "scopes": list(creds.scopes) if creds.scopes else SCOPES,
         }
-        with open(token_path, "w") as f:
-            json.dump(token_data, f)
+        if creds.expiry:
+            # Same format as Credentials.to_json() so expiry survives restarts
+            token_data["expiry"] = creds.expiry.isoformat() + "Z"
+        # Write to a temp file and rename so a crash never leaves a torn token
+        tmp_path = token_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps(token_data, separators=(",", ":")))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, token_path)
+
+        self._cache_credentials(user_id, token_path.stat().st_mtime_ns, creds)
+        self._auth_status_cache.pop(user_id, None)
+        self._invalidate_services(user_id)
+
+    def _get_cached_credentials(self, user_id: int, mtime_ns: int) -> Credentials | None:
+        """Get cached credentials if the token file has not changed.
+
+        Args:
+            user_id: Discord user ID.
+            mtime_ns: Current modification time of the user's token file.
+
+        Returns:
+            Cached Credentials object, or None on a cache miss.
+        """
+        entry = self._creds_cache.get(user_id)
+        if entry is None or entry[0] != mtime_ns:
+            return None
+        self._creds_cache.move_to_end(user_id)
+        return entry[1]
+
+    def _cache_credentials(self, user_id: int, mtime_ns: int, creds: Credentials) -> None:
+        """Store parsed credentials in the LRU cache.
+
+        Args:
+            user_id: Discord user ID.
+            mtime_ns: Modification time of the token file the creds match.
+            creds: Credentials object to cache.
+        """
+        self._creds_cache[user_id] = (mtime_ns, creds)
+        self._creds_cache.move_to_end(user_id)
+        if len(self._creds_cache) > CREDENTIALS_CACHE_SIZE:
+            self._creds_cache.popitem(last=False)
 
     def get_credentials(self, user_id: int) -> Credentials | None:
         """Get valid credentials for a user.
@@ -400,6 +875,42 @@ class CalendarAuthManager:
         """
         return self._load_credentials(user_id)
 
+    async def _get_fresh_credentials(self, user_id: int) -> Credentials | None:
+        """Get credentials for a user, refreshing the token off the event loop.
+
+        Like get_credentials, but the token refresh (an HTTPS round trip to
+        Google) runs on the API executor instead of blocking the loop.
+
+        Args:
+            user_id: Discord user ID.
+
+        Returns:
+            Valid Credentials object or None.
+        """
+        creds = self._load_credentials(user_id, refresh=False)
+        if creds is None or not self._needs_refresh(creds):
+            return creds
+
+        old_token = creds.token
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(_executor, creds.refresh, Request())
+        except Exception:
+            return None
+
+        if creds.token != old_token:
+            self._save_credentials(user_id, creds)
+        return creds
+
+    def _invalidate_events(self, user_id: int) -> None:
+        """Drop a user's cached list_events results.
+
+        Args:
+            user_id: Discord user ID.
+        """
+        for key in [key for key in self._events_cache if key[0] == user_id]:
+            del self._events_cache[key]
+
     def revoke_user(self, user_id: int) -> bool:
         """Revoke and delete user tokens.
 
@@ -409,6 +920,11 @@ class CalendarAuthManager:
         Returns:
             True if tokens were deleted, False if no tokens existed.
         """
+        self._creds_cache.pop(user_id, None)
+        self._auth_status_cache.pop(user_id, None)
+        self._invalidate_services(user_id)
+        self._invalidate_events(user_id)
+
         token_path = self._get_token_path(user_id)
         if token_path.exists():
             token_path.unlink()
@@ -422,8 +938,9 @@ class CalendarAuthManager:
     ) -> tuple[str, asyncio.Future]:
         """Start the OAuth 2.0 authorization flow.
 
-        This method generates an authorization URL and sets up a local server
-        to handle the callback.
+        This method generates an authorization URL and makes sure the local
+        asyncio callback server is listening. The server is shared by all
+        flows and dispatches callbacks by their state parameter.
 
         Args:
             user_id: Discord user ID.
@@ -435,22 +952,22 @@ class CalendarAuthManager:
 
         Raises:
             FileNotFoundError: If credentials.json is not found.
+            OSError: If the callback server cannot listen on redirect_port.
         """
-        if not self.is_credentials_configured():
-            raise FileNotFoundError(
-                f"OAuth credentials file not found: {self.credentials_file}"
-            )
+        client_config = self._get_client_config()
+
+        await self._ensure_callback_server(redirect_port)
 
         # Create OAuth flow
         redirect_uri = f"http://localhost:{redirect_port}/callback"
-        flow = Flow.from_client_secrets_file(
-            self.credentials_file,
+        flow = Flow.from_client_config(
+            client_config,
             scopes=SCOPES,
             redirect_uri=redirect_uri,
         )
 
         # Generate state for CSRF protection
-        state = secrets.token_urlsafe(32)
+        state = secrets.token_urlsafe(24)  # 192 bits
 
         # Generate authorization URL
         auth_url, _ = flow.authorization_url(
@@ -461,63 +978,52 @@ class CalendarAuthManager:
         )
 
         # Create a future to track completion
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         future = loop.create_future()
 
-        # Store pending auth info
-        with self._lock:
-            self._pending_auth[state] = {
-                "user_id": user_id,
-                "flow": flow,
-                "future": future,
-                "port": redirect_port,
-            }
-
-        # Start callback server in background
-        asyncio.create_task(
-            self._run_callback_server(state, redirect_port)
-        )
+        # Store pending auth info; the flow expires after OAUTH_CALLBACK_TIMEOUT
+        self._pending_auth[state] = {
+            "user_id": user_id,
+            "flow": flow,
+            "future": future,
+            "port": redirect_port,
+            "timeout": loop.call_later(
+                OAUTH_CALLBACK_TIMEOUT, self._handle_auth_timeout, state
+            ),
+        }
 
         return auth_url, future
 
-    async def _run_callback_server(self, state: str, port: int) -> None:
-        """Run a temporary HTTP server to handle OAuth callback.
+    async def _ensure_callback_server(self, port: int) -> None:
+        """Start the shared OAuth callback server on port if not yet running.
 
         Args:
-            state: The state parameter for this auth flow.
             port: Port to listen on.
-        """
-        # Set auth manager reference for the handler class
-        OAuthCallbackHandler.auth_manager = self
-
-        # Run server in a separate thread to avoid blocking
-        thread = threading.Thread(
-            target=self._run_server_thread,
-            args=(state, port),
-            daemon=True,
-        )
-        thread.start()
-
-    def _run_server_thread(self, state: str, port: int) -> None:
-        """Run the OAuth callback server in a thread.
 
-        Args:
-            state: The state parameter for this auth flow.
-            port: Port to listen on.
+        Raises:
+            OSError: If the port cannot be bound.
         """
-        server = HTTPServer(("localhost", port), OAuthCallbackHandler)
-        server.should_stop = False
-        server.timeout = 1  # Check every second
+        if port in self._callback_servers:
+            return
 
-        # Wait for callback with timeout
-        elapsed = 0
-        while not server.should_stop and elapsed < OAUTH_CALLBACK_TIMEOUT:
-            server.handle_request()
-            elapsed += 1
+        self._callback_servers[port] = await asyncio.start_server(
+            OAuthCallbackHandler(self), "localhost", port
+        )
 
-        # Handle timeout
-        if elapsed >= OAUTH_CALLBACK_TIMEOUT:
-            self._handle_auth_timeout(state)
+    async def close(self) -> None:
+        """Stop the OAuth callback servers and fail any pending flows."""
+        for state in list(self._pending_auth):
+            pending = self._pending_auth.pop(state)
+            pending["timeout"].cancel()
+            if not pending["future"].done():
+                pending["future"].cancel()
+
+        servers = list(self._callback_servers.values())
+        self._callback_servers.clear()
+        for server in servers:
+            server.close()
+        for server in servers:
+            await server.wait_closed()
 
     def _handle_auth_timeout(self, state: str) -> None:
         """Handle authentication timeout.
@@ -525,53 +1031,64 @@ class CalendarAuthManager:
         Args:
             state: The state parameter for the timed out auth flow.
         """
-        with self._lock:
-            pending = self._pending_auth.pop(state, None)
+        pending = self._pending_auth.pop(state, None)
 
         if pending and not pending["future"].done():
-            loop = pending["future"].get_loop()
-            loop.call_soon_threadsafe(
-                pending["future"].set_exception,
-                TimeoutError("Authentication timed out"),
-            )
+            pending["future"].set_exception(TimeoutError("Authentication timed out"))
 
     def get_auth_status(self, user_id: int) -> dict:
-        """Get authentication status for a user.
+        """Get credentials configuration and authentication status for a user.
 
         Args:
             user_id: Discord user ID.
 
         Returns:
-            Dict with status information.
+            Dict with status information, including "credentials_configured"
+            (whether credentials.json is usable) and "authenticated".
         """
+        if not self.is_credentials_configured():
+            return {
+                "credentials_configured": False,
+                "authenticated": False,
+                "message": "Not configured",
+            }
+
         token_path = self._get_token_path(user_id)
 
         if not token_path.exists():
-            return {
+            status = {
                 "authenticated": False,
                 "message": "Not connected",
             }
-
-        try:
-            creds = self._load_credentials(user_id)
-            if creds and creds.valid:
-                return {
-                    "authenticated": True,
-                    "message": "Connected",
-                    "has_refresh_token": bool(creds.refresh_token),
-                }
-            else:
-                return {
+        else:
+            try:
+                creds = self._load_credentials(user_id, refresh=False)
+                if self._is_usable(creds):
+                    status = {
+                        "authenticated": True,
+                        "message": "Connected",
+                        "has_refresh_token": bool(creds.refresh_token),
+                    }
+                else:
+                    status = {
+                        "authenticated": False,
+                        "message": "Token expired or invalid",
+                    }
+            except Exception as e:
+                status = {
                     "authenticated": False,
-                    "message": "Token expired or invalid",
+                    "message": f"Error: {e}",
                 }
-        except Exception as e:
-            return {
-                "authenticated": False,
-                "message": f"Error: {e}",
-            }
 
-    def _get_calendar_service(self, user_id: int):
+        # Share the result with is_user_authenticated
+        self._auth_status_cache[user_id] = (
+            time.monotonic() + AUTH_STATUS_TTL,
+            status["authenticated"],
+        )
+        status["credentials_configured"] = True
+        return status
+
+    async def _get_calendar_service(self, user_id: int):
         """Get Google Calendar API service for a user.
 
         Args:
@@ -583,10 +1100,54 @@ class CalendarAuthManager:
         Raises:
             ValueError: If user is not authenticated.
         """
-        creds = self.get_credentials(user_id)
+        return await self._get_service(user_id, "calendar", "v3")
+
+    async def _get_service(self, user_id: int, api: str, version: str):
+        """Get a cached Google API service object for a user.
+
+        The service is rebuilt only when the user's credentials object
+        changes (re-authentication or a token file change on disk).
+
+        Args:
+            user_id: Discord user ID.
+            api: API name (e.g., "calendar").
+            version: API version (e.g., "v3").
+
+        Returns:
+            Google API service object.
+
+        Raises:
+            ValueError: If user is not authenticated.
+        """
+        creds = await self._get_fresh_credentials(user_id)
         if not creds:
+            self._auth_status_cache.pop(user_id, None)
             raise ValueError("User is not authenticated")
-        return build("calendar", "v3", credentials=creds)
+
+        cache_key = (user_id, api)
+        cached = self._service_cache.get(cache_key)
+        if cached and cached[0] == id(creds):
+            return cached[1]
+
+        service = build(
+            api,
+            version,
+            credentials=creds,
+            cache_discovery=False,
+            static_discovery=True,
+            requestBuilder=_build_request,
+        )
+        self._service_cache[cache_key] = (id(creds), service)
+        return service
+
+    def _invalidate_services(self, user_id: int) -> None:
+        """Drop cached service objects for a user.
+
+        Args:
+            user_id: Discord user ID.
+        """
+        for cache_key in [k for k in self._service_cache if k[0] == user_id]:
+            del self._service_cache[cache_key]
 
     async def list_events(
         self,
@@ -608,46 +1169,105 @@ class CalendarAuthManager:
         Returns:
             List of event dictionaries.
         """
-        service = self._get_calendar_service(user_id)
+        # Identical queries within EVENTS_CACHE_TTL share one API call
+        key = (user_id, calendar_id, time_min, time_max, max_results)
+        now = time.monotonic()
+        cached = self._events_cache.get(key)
+        if cached and now < cached[0]:
+            self._events_cache.move_to_end(key)
+            task = cached[1]
+        else:
+            task = asyncio.ensure_future(
+                self._fetch_events(user_id, time_min, time_max, max_results, calendar_id)
+            )
+            # In-flight fetches never expire, so later identical queries join
+            # them however long they take; the TTL starts once they finish
+            self._events_cache[key] = (float("inf"), task)
+            task.add_done_callback(functools.partial(self._start_events_ttl, key))
+            if len(self._events_cache) > EVENTS_CACHE_SIZE:
+                self._events_cache.popitem(last=False)
+
+        try:
+            return list(await asyncio.shield(task))
+        except Exception:
+            # Don't cache failures
+            if self._events_cache.get(key, (0, None))[1] is task:
+                del self._events_cache[key]
+            raise
+
+    def _start_events_ttl(self, key: tuple, task: asyncio.Task) -> None:
+        """Start the expiry countdown of a finished list_events fetch.
+
+        Args:
+            key: list_events cache key.
+            task: The finished fetch task.
+        """
+        entry = self._events_cache.get(key)
+        if entry is not None and entry[1] is task:
+            self._events_cache[key] = (time.monotonic() + EVENTS_CACHE_TTL, task)
+
+    async def _fetch_events(
+        self,
+        user_id: int,
+        time_min: str | None,
+        time_max: str | None,
+        max_results: int,
+        calendar_id: str,
+    ) -> list[dict]:
+        """Fetch events from the Calendar API (see list_events).
+
+        Args:
+            user_id: Discord user ID.
+            time_min: Start time in ISO 8601 format (defaults to now).
+            time_max: End time in ISO 8601 format (optional).
+            max_results: Maximum number of events to return.
+            calendar_id: Calendar ID.
+
+        Returns:
+            List of event dictionaries.
+        """
+        service = await self._get_calendar_service(user_id)
 
         # Default time_min to now if not specified
         if not time_min:
-            time_min = datetime.now(timezone.utc).isoformat()
-
-        # Run in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        events_result = await loop.run_in_executor(
-            None,
-            lambda: service.events()
-            .list(
-                calendarId=calendar_id,
-                timeMin=time_min,
-                timeMax=time_max,
-                maxResults=max_results,
-                singleEvents=True,
-                orderBy="startTime",
+            time_min = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+        # Google may return short pages; follow nextPageToken only until
+        # max_results events have been collected, asking for just the rest
+        events = []
+        page_token = None
+        while len(events) < max_results:
+            events_result = await _execute(
+                service.events()
+                .list(
+                    calendarId=calendar_id,
+                    timeMin=time_min,
+                    timeMax=time_max,
+                    maxResults=max_results - len(events),
+                    singleEvents=True,
+                    orderBy="startTime",
+                    pageToken=page_token,
+                    fields=LIST_EVENTS_FIELDS,
+                ),
             )
-            .execute(),
-        )
-
-        events = events_result.get("items", [])
+            events.extend(events_result.get("items", ()))
+            page_token = events_result.get("nextPageToken")
+            if not page_token:
+                break
 
         # Convert to simplified format
-        result = []
-        for event in events:
-            start = event.get("start", {})
-            end = event.get("end", {})
-            result.append({
+        return [
+            {
                 "id": event.get("id"),
                 "summary": event.get("summary", "(No title)"),
                 "description": event.get("description", ""),
                 "location": event.get("location", ""),
-                "start": start.get("dateTime") or start.get("date"),
-                "end": end.get("dateTime") or end.get("date"),
+                "start": _event_time(event.get("start")),
+                "end": _event_time(event.get("end")),
                 "html_link": event.get("htmlLink"),
-            })
-
-        return result
+            }
+            for event in events[:max_results]
+        ]
 
     async def create_event(
         self,
@@ -673,40 +1293,16 @@ class CalendarAuthManager:
         Returns:
             Created event dictionary.
         """
-        service = self._get_calendar_service(user_id)
+        service = await self._get_calendar_service(user_id)
 
-        # Determine if this is an all-day event or timed event
-        # All-day events use 'date', timed events use 'dateTime'
-        if "T" in start_time:
-            start = {"dateTime": start_time, "timeZone": "Asia/Tokyo"}
-            end = {"dateTime": end_time, "timeZone": "Asia/Tokyo"}
-        else:
-            start = {"date": start_time}
-            end = {"date": end_time}
-
-        event_body = {
-            "summary": summary,
-            "description": description,
-            "location": location,
-            "start": start,
-            "end": end,
-        }
-
-        loop = asyncio.get_event_loop()
-        event = await loop.run_in_executor(
-            None,
-            lambda: service.events()
-            .insert(calendarId=calendar_id, body=event_body)
-            .execute(),
+        event_body = _event_fields(summary, start_time, end_time, description, location)
+        event = await _execute(
+            service.events()
+            .insert(calendarId=calendar_id, body=event_body, fields=EVENT_RESULT_FIELDS),
         )
+        self._invalidate_events(user_id)
 
-        return {
-            "id": event.get("id"),
-            "summary": event.get("summary"),
-            "start": event.get("start", {}).get("dateTime") or event.get("start", {}).get("date"),
-            "end": event.get("end", {}).get("dateTime") or event.get("end", {}).get("date"),
-            "html_link": event.get("htmlLink"),
-        }
+        return _simplify_event(event)
 
     async def update_event(
         self,
@@ -734,50 +1330,30 @@ class CalendarAuthManager:
         Returns:
             Updated event dictionary.
         """
-        service = self._get_calendar_service(user_id)
+        service = await self._get_calendar_service(user_id)
 
         # First, get the existing event
-        loop = asyncio.get_event_loop()
-        event = await loop.run_in_executor(
-            None,
-            lambda: service.events()
-            .get(calendarId=calendar_id, eventId=event_id)
-            .execute(),
+        event = await _execute(
+            service.events()
+            .get(calendarId=calendar_id, eventId=event_id),
         )
 
         # Update fields if provided
-        if summary is not None:
-            event["summary"] = summary
-        if description is not None:
-            event["description"] = description
-        if location is not None:
-            event["location"] = location
-        if start_time is not None:
-            if "T" in start_time:
-                event["start"] = {"dateTime": start_time, "timeZone": "Asia/Tokyo"}
-            else:
-                event["start"] = {"date": start_time}
-        if end_time is not None:
-            if "T" in end_time:
-                event["end"] = {"dateTime": end_time, "timeZone": "Asia/Tokyo"}
-            else:
-                event["end"] = {"date": end_time}
+        event.update(_event_fields(summary, start_time, end_time, description, location))
 
         # Update the event
-        updated_event = await loop.run_in_executor(
-            None,
-            lambda: service.events()
-            .update(calendarId=calendar_id, eventId=event_id, body=event)
-            .execute(),
+        updated_event = await _execute(
+            service.events()
+            .update(
+                calendarId=calendar_id,
+                eventId=event_id,
+                body=event,
+                fields=EVENT_RESULT_FIELDS,
+            ),
         )
+        self._invalidate_events(user_id)
 
-        return {
-            "id": updated_event.get("id"),
-            "summary": updated_event.get("summary"),
-            "start": updated_event.get("start", {}).get("dateTime") or updated_event.get("start", {}).get("date"),
-            "end": updated_event.get("end", {}).get("dateTime") or updated_event.get("end", {}).get("date"),
-            "html_link": updated_event.get("htmlLink"),
-        }
+        return _simplify_event(updated_event)
 
     async def delete_event(
         self,
@@ -795,21 +1371,130 @@ class CalendarAuthManager:
         Returns:
             True if deletion was successful.
         """
-        service = self._get_calendar_service(user_id)
-
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            lambda: service.events()
-            .delete(calendarId=calendar_id, eventId=event_id)
-            .execute(),
+        service = await self._get_calendar_service(user_id)
+        await _execute(
+            service.events()
+            .delete(calendarId=calendar_id, eventId=event_id),
         )
+        self._invalidate_events(user_id)
 
         return True
 
+    # Calendar event methods accepted by batch_events()
+    BATCH_EVENT_METHODS = frozenset({"list", "get", "insert", "update", "patch", "delete"})
+
+    async def batch_events(
+        self,
+        user_id: int,
+        operations: list[tuple[str, dict]],
+        calendar_id: str = "primary",
+    ) -> list[dict | Exception | None]:
+        """Execute several Calendar event operations in one HTTP batch request.
+
+        Args:
+            user_id: Discord user ID.
+            operations: List of (method, params) tuples, where method is one of
+                BATCH_EVENT_METHODS and params are the keyword arguments for
+                service.events().<method>() (e.g. ("insert", {"body": {...}})).
+                calendarId defaults to calendar_id.
+            calendar_id: Calendar ID (defaults to "primary").
+
+        Returns:
+            Raw API responses in the same order as operations. A failed
+            operation yields its exception (usually HttpError) instead.
+
+        Raises:
+            ValueError: If an operation method is not supported, there are more
+                than MAX_BATCH_SIZE operations, or the user is not authenticated.
+        """
+        if len(operations) > MAX_BATCH_SIZE:
+            raise ValueError(f"At most {MAX_BATCH_SIZE} operations per batch")
+
+        service = await self._get_calendar_service(user_id)
+        results: list[dict | Exception | None] = [None] * len(operations)
+
+        def on_response(request_id: str, response, exception) -> None:
+            results[int(request_id)] = exception if exception is not None else response
+
+        batch = service.new_batch_http_request(callback=on_response)
+        events = service.events()
+        for index, (method, params) in enumerate(operations):
+            if method not in self.BATCH_EVENT_METHODS:
+                raise ValueError(f"Unsupported batch operation: {method}")
+            batch.add(
+                getattr(events, method)(**{"calendarId": calendar_id, **params}),
+                request_id=str(index),
+            )
+
+        if operations:
+            try:
+                await _execute(batch)
+            finally:
+                self._invalidate_events(user_id)
+
+        return results
+
+    async def batch_event_changes(
+        self,
+        user_id: int,
+        changes: list[tuple[str, dict]],
+        calendar_id: str = "primary",
+    ) -> list[dict | bool | Exception]:
+        """Create, update and delete several events with one batch request.
+
+        Updates are sent as patches, so unlike update_event they don't need
+        to fetch the event first.
+
+        Args:
+            user_id: Discord user ID.
+            changes: List of (action, kwargs) tuples. action is "create",
+                "update" or "delete"; kwargs are the keyword arguments of
+                create_event, update_event or delete_event (without user_id
+                and calendar_id).
+            calendar_id: Calendar ID (defaults to "primary").
+
+        Returns:
+            For each change, what the single-event method would return, or
+            the exception the change failed with.
+
+        Raises:
+            ValueError: If an action is unknown (see also batch_events).
+        """
+        operations = []
+        for action, kwargs in changes:
+            if action == "create":
+                operations.append(("insert", {
+                    "body": _event_fields(**kwargs),
+                    "fields": EVENT_RESULT_FIELDS,
+                }))
+            elif action == "update":
+                values = dict(kwargs)
+                event_id = values.pop("event_id")
+                operations.append(("patch", {
+                    "eventId": event_id,
+                    "body": _event_fields(**values, patch=True),
+                    "fields": EVENT_RESULT_FIELDS,
+                }))
+            elif action == "delete":
+                operations.append(("delete", {"eventId": kwargs["event_id"]}))
+            else:
+                raise ValueError(f"Unknown event change: {action}")
+
+        responses = await self.batch_events(user_id, operations, calendar_id)
+
+        results = []
+        for (action, _), response in zip(changes, responses):
+            if isinstance(response, Exception):
+                results.append(response)
+            elif action == "delete":
+                results.append(True)
+            else:
+                results.append(_simplify_event(response))
+        return results
+
     # ==================== Google Tasks API Methods ====================
 
-    def _get_tasks_service(self, user_id: int):
+    async def _get_tasks_service(self, user_id: int):
         """Get Google Tasks API service for a user.
 
         Args:
@@ -821,10 +1506,7 @@ class CalendarAuthManager:
         Raises:
             ValueError: If user is not authenticated.
         """
-        creds = self.get_credentials(user_id)
-        if not creds:
-            raise ValueError("User is not authenticated")
-        return build("tasks", "v1", credentials=creds)
+        return await self._get_service(user_id, "tasks", "v1")
 
     async def list_task_lists(
         self,
@@ -840,14 +1522,10 @@ class CalendarAuthManager:
         Returns:
             List of task list dictionaries.
         """
-        service = self._get_tasks_service(user_id)
-
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None,
-            lambda: service.tasklists()
-            .list(maxResults=max_results)
-            .execute(),
+        service = await self._get_tasks_service(user_id)
+        result = await _execute(
+            service.tasklists()
+            .list(maxResults=max_results),
         )
 
         task_lists = result.get("items", [])
@@ -880,19 +1558,15 @@ class CalendarAuthManager:
         Returns:
             List of task dictionaries.
         """
-        service = self._get_tasks_service(user_id)
-
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None,
-            lambda: service.tasks()
+        service = await self._get_tasks_service(user_id)
+        result = await _execute(
+            service.tasks()
             .list(
                 tasklist=tasklist_id,
                 showCompleted=show_completed,
                 showHidden=show_hidden,
                 maxResults=max_results,
-            )
-            .execute(),
+            ),
         )
 
         tasks = result.get("items", [])
@@ -930,7 +1604,7 @@ class CalendarAuthManager:
         Returns:
             Created task dictionary.
         """
-        service = self._get_tasks_service(user_id)
+        service = await self._get_tasks_service(user_id)
 
         task_body = {
             "title": title,
@@ -938,13 +1612,9 @@ class CalendarAuthManager:
         }
         if due:
             task_body["due"] = due
-
-        loop = asyncio.get_event_loop()
-        task = await loop.run_in_executor(
-            None,
-            lambda: service.tasks()
-            .insert(tasklist=tasklist_id, body=task_body)
-            .execute(),
+        task = await _execute(
+            service.tasks()
+            .insert(tasklist=tasklist_id, body=task_body),
         )
 
         return {
@@ -979,15 +1649,12 @@ class CalendarAuthManager:
         Returns:
             Updated task dictionary.
         """
-        service = self._get_tasks_service(user_id)
+        service = await self._get_tasks_service(user_id)
 
         # First, get the existing task
-        loop = asyncio.get_event_loop()
-        task = await loop.run_in_executor(
-            None,
-            lambda: service.tasks()
-            .get(tasklist=tasklist_id, task=task_id)
-            .execute(),
+        task = await _execute(
+            service.tasks()
+            .get(tasklist=tasklist_id, task=task_id),
         )
 
         # Update fields if provided
@@ -1007,11 +1674,9 @@ class CalendarAuthManager:
                 task.pop("completed", None)
 
         # Update the task
-        updated_task = await loop.run_in_executor(
-            None,
-            lambda: service.tasks()
-            .update(tasklist=tasklist_id, task=task_id, body=task)
-            .execute(),
+        updated_task = await _execute(
+            service.tasks()
+            .update(tasklist=tasklist_id, task=task_id, body=task),
         )
 
         return {
@@ -1062,14 +1727,10 @@ class CalendarAuthManager:
         Returns:
             True if deletion was successful.
         """
-        service = self._get_tasks_service(user_id)
-
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            lambda: service.tasks()
-            .delete(tasklist=tasklist_id, task=task_id)
-            .execute(),
+        service = await self._get_tasks_service(user_id)
+        await _execute(
+            service.tasks()
+            .delete(tasklist=tasklist_id, task=task_id),
         )
 
         return True
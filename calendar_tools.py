@@ -4,19 +4,83 @@ This module defines the function declarations and handlers for
 Google Calendar integration with Gemini API.
 """
 
-from datetime import datetime, timedelta, timezone
+import asyncio
+import functools
+
 from google.genai import types
+from googleapiclient.errors import HttpError
 
-from calendar_manager import CalendarAuthManager
+from calendar_manager import MAX_BATCH_SIZE, CalendarAuthManager, is_rate_limit_error
 from i18n import I18nManager
 
 
+# Error codes returned to Gemini per HTTP status, so it can tell a call that
+# may succeed later from one that never will
+HTTP_ERROR_CODES = {
+    400: "invalid_args",
+    401: "not_authenticated",
+    403: "forbidden",
+    404: "not_found",
+    410: "not_found",
+    429: "rate_limited",
+}
+
+
+def api_error_response(error: Exception) -> dict:
+    """Build the function response for a failed API call.
+
+    Args:
+        error: Exception raised by the call.
+
+    Returns:
+        Error dictionary with a classified error code; HttpErrors also carry
+        the HTTP status and, when Google sends one, a Retry-After hint.
+    """
+    if not isinstance(error, HttpError):
+        return {"error": "api_error", "message": str(error)}
+
+    status = error.resp.status
+    if is_rate_limit_error(error):
+        code = "rate_limited"
+    elif status >= 500:
+        code = "server_error"
+    else:
+        code = HTTP_ERROR_CODES.get(status, "api_error")
+
+    response = {"error": code, "status": status, "message": error.reason or str(error)}
+    retry_after = error.resp.get("retry-after")
+    if retry_after:
+        response["retry_after"] = retry_after
+    return response
+
+
 def get_calendar_tools(i18n: I18nManager) -> list[types.Tool]:
     """Get the list of calendar tools for Gemini.
 
+    The declarations only depend on the translations, so they are built once
+    per language (and translations reload) and shared. Callers must not
+    modify the returned list.
+
     Args:
         i18n: I18nManager instance for translations.
 
+    Returns:
+        List of Tool objects for calendar operations.
+    """
+    return _build_calendar_tools(i18n, i18n.language, i18n.translations_version)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_calendar_tools(
+    i18n: I18nManager, language: str, translations_version: int
+) -> list[types.Tool]:
+    """Build the calendar tool declarations for a language.
+
+    Args:
+        i18n: I18nManager instance for translations.
+        language: Current language code (cache key).
+        translations_version: I18nManager.translations_version (cache key).
+
     Returns:
         List of Tool objects for calendar operations.
     """
@@ -132,6 +196,36 @@ def get_calendar_tools(i18n: I18nManager) -> list[types.Tool]:
 class CalendarToolHandler:
     """Handles calendar tool calls from Gemini."""
 
+    # Response messages without format arguments, translated once per language
+    STATIC_MESSAGES = (
+        "calendar_not_authenticated",
+        "calendar_deleted",
+        "calendar_events_empty",
+        "calendar_no_changes",
+    )
+
+    # Event change functions: name -> (action, required args, optional args
+    # with their defaults); all arguments are strings
+    EVENT_CHANGE_ARGS = {
+        "create_calendar_event": (
+            "create",
+            ("summary", "start_time", "end_time"),
+            {"description": "", "location": ""},
+        ),
+        "update_calendar_event": (
+            "update",
+            ("event_id",),
+            {
+                "summary": None,
+                "start_time": None,
+                "end_time": None,
+                "description": None,
+                "location": None,
+            },
+        ),
+        "delete_calendar_event": ("delete", ("event_id",), {}),
+    }
+
     def __init__(self, calendar_auth: CalendarAuthManager, i18n: I18nManager):
         """Initialize the handler.
 
@@ -141,10 +235,30 @@ class CalendarToolHandler:
         """
         self.calendar_auth = calendar_auth
         self.i18n = i18n
+        self._t = i18n.t
+        # (language, translations_version) -> translated STATIC_MESSAGES
+        self._static_messages: dict[tuple[str, int], dict[str, str]] = {}
+
+        # Function name -> handler coroutine
+        self._handlers = {
+            "list_calendar_events": self._handle_list_events,
+            "create_calendar_event": self._handle_create_event,
+            "update_calendar_event": self._handle_update_event,
+            "delete_calendar_event": self._handle_delete_event,
+        }
+
+    def _messages(self) -> dict[str, str]:
+        """Get the STATIC_MESSAGES translated into the current language.
 
-    def t(self, key: str, **kwargs) -> str:
-        """Get translated string."""
-        return self.i18n.t(key, **kwargs)
+        Returns:
+            Translation key -> translated message.
+        """
+        cache_key = (self.i18n.language, self.i18n.translations_version)
+        messages = self._static_messages.get(cache_key)
+        if messages is None:
+            messages = {key: self._t(key) for key in self.STATIC_MESSAGES}
+            self._static_messages[cache_key] = messages
+        return messages
 
     async def handle_function_call(
         self,
@@ -166,22 +280,167 @@ class CalendarToolHandler:
         if not self.calendar_auth.is_user_authenticated(user_id):
             return {
                 "error": "not_authenticated",
-                "message": self.t("calendar_not_authenticated"),
+                "message": self._messages()["calendar_not_authenticated"],
             }
 
+        handler = self._handlers.get(function_name)
+        if handler is None:
+            return {"error": "unknown_function", "message": f"Unknown function: {function_name}"}
+
         try:
-            if function_name == "list_calendar_events":
-                return await self._handle_list_events(user_id, function_args)
-            elif function_name == "create_calendar_event":
-                return await self._handle_create_event(user_id, function_args)
-            elif function_name == "update_calendar_event":
-                return await self._handle_update_event(user_id, function_args)
-            elif function_name == "delete_calendar_event":
-                return await self._handle_delete_event(user_id, function_args)
-            else:
-                return {"error": "unknown_function", "message": f"Unknown function: {function_name}"}
+            return await handler(user_id, function_args)
         except Exception as e:
-            return {"error": "api_error", "message": str(e)}
+            return api_error_response(e)
+
+    async def handle_function_calls(
+        self,
+        function_calls: list[tuple[str, dict]],
+        user_id: int,
+    ) -> list[dict]:
+        """Handle several calendar function calls from one Gemini turn.
+
+        When every call creates, updates or deletes an event, they are sent
+        to Google as a single batch request instead of one request each;
+        otherwise the calls run concurrently.
+
+        Args:
+            function_calls: List of (function_name, function_args) tuples.
+            user_id: Discord user ID.
+
+        Returns:
+            Result dictionaries, in the same order as function_calls.
+        """
+        try:
+            changes = [
+                self._event_change(function_name, function_args)
+                for function_name, function_args in function_calls
+            ]
+        except (KeyError, ValueError):
+            changes = None
+
+        # Fall back to one request per call for anything that can't be
+        # batched; the calls are independent, so run them concurrently
+        if changes is None or not 2 <= len(function_calls) <= MAX_BATCH_SIZE:
+            return list(await asyncio.gather(*(
+                self.handle_function_call(function_name, function_args, user_id)
+                for function_name, function_args in function_calls
+            )))
+
+        if not self.calendar_auth.is_user_authenticated(user_id):
+            return [
+                {"error": "not_authenticated", "message": self._messages()["calendar_not_authenticated"]}
+                for _ in function_calls
+            ]
+
+        # Updates that change nothing need no API call
+        results: list[dict | None] = [
+            self._no_changes_result(kwargs) if self._is_noop(action, kwargs) else None
+            for action, kwargs in changes
+        ]
+        pending = [index for index, result in enumerate(results) if result is None]
+        if pending:
+            try:
+                responses = await self.calendar_auth.batch_event_changes(
+                    user_id, [changes[index] for index in pending]
+                )
+            except Exception as e:
+                responses = [e] * len(pending)
+
+            for index, response in zip(pending, responses):
+                if isinstance(response, Exception):
+                    results[index] = api_error_response(response)
+                else:
+                    results[index] = self._change_result(changes[index][0], response)
+
+        return results
+
+    @classmethod
+    def _event_change(cls, function_name: str, args: dict) -> tuple[str, dict]:
+        """Validate an event change function call and convert it to (action, kwargs).
+
+        kwargs are the keyword arguments for the matching CalendarAuthManager
+        method, as used by batch_event_changes().
+
+        Args:
+            function_name: Name of the function to call.
+            args: Arguments for the function.
+
+        Returns:
+            (action, kwargs) tuple.
+
+        Raises:
+            KeyError: If the function is not an event change.
+            ValueError: If a required argument is missing or an argument is
+                not a string.
+        """
+        action, required, optional = cls.EVENT_CHANGE_ARGS[function_name]
+
+        missing = [name for name in required if not args.get(name)]
+        if missing:
+            raise ValueError(f"Missing required argument(s): {', '.join(missing)}")
+
+        kwargs = {name: args[name] for name in required}
+        for name, default in optional.items():
+            kwargs[name] = args.get(name, default)
+
+        invalid = [
+            name for name, value in kwargs.items()
+            if value is not None and not isinstance(value, str)
+        ]
+        if invalid:
+            raise ValueError(f"Argument(s) must be strings: {', '.join(invalid)}")
+
+        return action, kwargs
+
+    @staticmethod
+    def _is_noop(action: str, kwargs: dict) -> bool:
+        """Check whether an event change would not modify anything.
+
+        Args:
+            action: "create", "update" or "delete".
+            kwargs: Keyword arguments from _event_change.
+
+        Returns:
+            True for an update without any field to change.
+        """
+        return action == "update" and all(
+            value is None for name, value in kwargs.items() if name != "event_id"
+        )
+
+    def _no_changes_result(self, kwargs: dict) -> dict:
+        """Build the function response for an update that changes nothing.
+
+        Args:
+            kwargs: Keyword arguments from _event_change.
+
+        Returns:
+            Result dictionary with the function response.
+        """
+        return {
+            "success": True,
+            "message": self._messages()["calendar_no_changes"],
+            "event_id": kwargs["event_id"],
+        }
+
+    def _change_result(self, action: str, result: dict | bool) -> dict:
+        """Build the function response for a successful event change.
+
+        Args:
+            action: "create", "update" or "delete".
+            result: Event dictionary (create/update) or True (delete).
+
+        Returns:
+            Result dictionary with the function response.
+        """
+        if action == "delete":
+            return {"success": True, "message": self._messages()["calendar_deleted"]}
+
+        key = "calendar_created" if action == "create" else "calendar_updated"
+        return {
+            "success": True,
+            "message": self._t(key, summary=result["summary"]),
+            "event": result,
+        }
 
     async def _handle_list_events(self, user_id: int, args: dict) -> dict:
         """Handle list_calendar_events function call."""
@@ -189,57 +448,32 @@ class CalendarToolHandler:
             user_id=user_id,
             time_min=args.get("time_min"),
             time_max=args.get("time_max"),
-            max_results=args.get("max_results", 10),
+            # JSON numbers from Gemini may arrive as floats
+            max_results=int(args.get("max_results", 10)),
         )
 
         if not events:
-            return {"events": [], "message": self.t("calendar_events_empty")}
+            return {"events": [], "message": self._messages()["calendar_events_empty"]}
 
         return {"events": events, "count": len(events)}
 
     async def _handle_create_event(self, user_id: int, args: dict) -> dict:
         """Handle create_calendar_event function call."""
-        event = await self.calendar_auth.create_event(
-            user_id=user_id,
-            summary=args["summary"],
-            start_time=args["start_time"],
-            end_time=args["end_time"],
-            description=args.get("description", ""),
-            location=args.get("location", ""),
-        )
-
-        return {
-            "success": True,
-            "message": self.t("calendar_created", summary=event["summary"]),
-            "event": event,
-        }
+        _, kwargs = self._event_change("create_calendar_event", args)
+        event = await self.calendar_auth.create_event(user_id=user_id, **kwargs)
+        return self._change_result("create", event)
 
     async def _handle_update_event(self, user_id: int, args: dict) -> dict:
         """Handle update_calendar_event function call."""
-        event = await self.calendar_auth.update_event(
-            user_id=user_id,
-            event_id=args["event_id"],
-            summary=args.get("summary"),
-            start_time=args.get("start_time"),
-            end_time=args.get("end_time"),
-            description=args.get("description"),
-            location=args.get("location"),
-        )
+        action, kwargs = self._event_change("update_calendar_event", args)
+        if self._is_noop(action, kwargs):
+            return self._no_changes_result(kwargs)
 
-        return {
-            "success": True,
-            "message": self.t("calendar_updated", summary=event["summary"]),
-            "event": event,
-        }
+        event = await self.calendar_auth.update_event(user_id=user_id, **kwargs)
+        return self._change_result("update", event)
 
     async def _handle_delete_event(self, user_id: int, args: dict) -> dict:
         """Handle delete_calendar_event function call."""
-        await self.calendar_auth.delete_event(
-            user_id=user_id,
-            event_id=args["event_id"],
-        )
-
-        return {
-            "success": True,
-            "message": self.t("calendar_deleted"),
-        }
+        _, kwargs = self._event_change("delete_calendar_event", args)
+        await self.calendar_auth.delete_event(user_id=user_id, **kwargs)
+        return self._change_result("delete", True)
@@ -1,8 +1,13 @@
 import asyncio
 import base64
+import bisect
 import io
+import itertools
+import tempfile
+import time
 import zipfile
 from datetime import datetime
+from pathlib import Path
 from typing import Literal
 
 import discord
@@ -11,6 +16,86 @@ from discord.ext import commands
 from google.genai import types
 
 from calendar_manager import CalendarAuthManager
+from history_manager import local_timestamp
+
+
+# Name fragments of Gemini models that cannot be used for chat
+NON_CHAT_MODEL_TAGS = frozenset({"embedding", "aqa", "tts"})
+
+# Tool modes that need a linked Google account
+AUTH_REQUIRED_MODES = frozenset({"calendar", "todo"})
+
+# How long the fetched model list is reused before asking the API again (seconds)
+MODEL_LIST_TTL = 300
+
+# Exports larger than this spill from memory to a temporary file
+EXPORT_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+# Deflate level for text in exports; fast, since the payload is small and
+# images are stored uncompressed anyway
+EXPORT_COMPRESS_LEVEL = 1
+
+# File extensions for generated image MIME types (PNG when unknown)
+IMAGE_MIME_TO_EXT = {
+    "image/png": "png",
+    "image/jpeg": "jpg",
+    "image/jpg": "jpg",
+    "image/webp": "webp",
+    "image/gif": "gif",
+}
+
+# Image formats that are already compressed and gain nothing from deflate
+PRECOMPRESSED_MIME_TYPES = frozenset({"image/png", "image/jpeg", "image/gif", "image/webp"})
+
+
+def _read_text_or_empty(path: Path) -> str:
+    """Read a UTF-8 text file, returning an empty string if it doesn't exist."""
+    return path.read_text(encoding="utf-8") if path.exists() else ""
+
+
+class _ChoiceIndex:
+    """Autocomplete corpus supporting fast prefix lookups.
+
+    Names are kept in display order for substring matching and in a sorted,
+    lowercased copy so prefix matches can be found with a binary search.
+    """
+
+    MAX_CHOICES = 25
+
+    def __init__(self, names):
+        """Build the index.
+
+        Args:
+            names: Candidate names in display order.
+        """
+        self._ordered = [(name.lower(), app_commands.Choice(name=name, value=name)) for name in names]
+        ranked = sorted(self._ordered, key=lambda item: item[0])
+        self._sorted_names = [name for name, _ in ranked]
+        self._sorted_choices = [choice for _, choice in ranked]
+
+    def match(self, current: str) -> list[app_commands.Choice[str]]:
+        """Return up to MAX_CHOICES choices matching the typed text.
+
+        Prefix matches come first (alphabetically), followed by other
+        names containing the text in display order.
+        """
+        if not current:
+            return [choice for _, choice in self._ordered[: self.MAX_CHOICES]]
+
+        current = current.lower()
+        lo = bisect.bisect_left(self._sorted_names, current)
+        hi = bisect.bisect_right(self._sorted_names, current + "\uffff", lo)
+        matches = self._sorted_choices[lo : min(hi, lo + self.MAX_CHOICES)]
+        if len(matches) == self.MAX_CHOICES:
+            return matches
+
+        # Not enough prefix matches; fill up with substring matches
+        for name, choice in self._ordered:
+            if current in name and not name.startswith(current):
+                matches.append(choice)
+                if len(matches) == self.MAX_CHOICES:
+                    break
+        return matches
 
 
 class Commands(commands.Cog):
@@ -27,9 +112,45 @@ class Commands(commands.Cog):
         "todo": "Todo - Google Tasks (Requires Link)",
     }
 
+    # Translation keys describing each credentials.json configuration error
+    GOOGLE_SETUP_ERROR_KEYS = {
+        "file_not_found": "google_setup_file_not_found",
+        "invalid_json": "google_setup_invalid_json",
+        "missing_installed": "google_setup_wrong_format",
+        "missing_client_id": "google_setup_missing_fields",
+        "missing_client_secret": "google_setup_missing_fields",
+    }
+
+    # Translation table flattening line breaks in message previews
+    _NEWLINE_TO_SPACE = str.maketrans({"\n": " ", "\r": " "})
+
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
+        # Autocomplete indexes, rebuilt when the bot's ordered model list or
+        # the history manager's branch names for a channel change.
+        self._model_choice_cache: tuple[tuple[str, ...], _ChoiceIndex] | None = None
+        self._branch_choice_cache: dict[int, tuple[frozenset[str], _ChoiceIndex]] = {}
+        schema = self.bot.history_manager.GENERATION_CONFIG_SCHEMA
+        self._config_key_choices = _ChoiceIndex(schema.keys())
+
+        # /config show field labels: (key, "key (min - max)")
+        self._config_fields = [
+            (key, f"{key} ({key_schema['min']} - {key_schema['max']})")
+            for key, key_schema in schema.items()
+        ]
+
+        # Standalone manager for setup guide status checks (created on demand
+        # when Google integration is disabled)
+        self._setup_check_auth: CalendarAuthManager | None = None
+
+        # Last fetched model list: (expires_at, recommended, other_models)
+        self._models_cache: tuple[float, list[str], list[str]] | None = None
+        # Held while refetching so concurrent callers share one API request
+        self._models_fetch_lock = asyncio.Lock()
+        # Rendered model list embed fields for that list: (recommended, other)
+        self._model_list_fields: tuple[str, str] = ("", "")
+
     def t(self, key: str, **kwargs) -> str:
         """Shortcut for translation."""
         return self.bot.i18n.t(key, **kwargs)
@@ -44,18 +165,12 @@ class Commands(commands.Cog):
         Returns:
             Tuple of (recommended_models, other_models) lists.
         """
-        models = [m async for m in await self.bot.gemini_client.aio.models.list()]
-
-        # Extract and clean model names
-        model_names = []
-        for m in models:
-            name = m.name
-            if name:
-                if name.startswith("models/"):
-                    name = name.replace("models/", "")
-                model_names.append(name)
-
-        model_names.sort()
+        # Extract and clean names of models that can generate content
+        model_names = sorted([
+            m.name.removeprefix("models/")
+            async for m in await self.bot.gemini_client.aio.models.list()
+            if m.name and self._supports_generate_content(m)
+        ])
 
         # Separate recommended from others
         recommended = [m for m in self.RECOMMENDED_MODELS if m in model_names]
@@ -63,55 +178,63 @@ class Commands(commands.Cog):
 
         return recommended, other_models
 
-    async def _is_model_usable(self, model_name: str) -> bool:
-        """Check if a model is usable by making a simple API call.
+    @staticmethod
+    def _supports_generate_content(model: types.Model) -> bool:
+        """Check whether a listed model supports generateContent.
 
         Args:
-            model_name: Name of the model to test.
+            model: Model entry returned by models.list.
 
         Returns:
-            True if model is usable, False otherwise.
+            True if the model can be used for chat, False otherwise.
         """
-        try:
-            response = await self.bot.gemini_client.aio.models.generate_content(
-                model=model_name,
-                config=types.GenerateContentConfig(
-                    system_instruction="",
-                ),
-                contents="Hi",
-            )
-            return response is not None
-        except Exception as e:
-            error_str = str(e)
-            if "404" in error_str or "429" in error_str or "400" in error_str:
-                return False
-            return False
+        if model.supported_actions is not None:
+            return "generateContent" in model.supported_actions
+
+        # Older API responses may omit supported actions; fall back to names
+        name = model.name.removeprefix("models/")
+        return name.startswith("gemini-") and not any(
+            tag in name for tag in NON_CHAT_MODEL_TAGS
+        )
 
     async def _fetch_models_to_cache(self) -> None:
         """Fetch models from API and cache them on the bot instance."""
-        recommended, all_models = await self._fetch_and_sort_models()
+        recommended, other_models = await self._fetch_and_sort_models()
+        self._models_cache = (time.monotonic() + MODEL_LIST_TTL, recommended, other_models)
+        self._model_list_fields = self._render_model_list_fields(recommended, other_models)
+        self.bot.set_available_models(recommended, sorted(recommended + other_models))
 
-        # Filter to only usable models
-        usable_models = []
-        semaphore = asyncio.Semaphore(5)
+    async def _get_sorted_models(self) -> tuple[list[str], list[str]]:
+        """Get the model list, refetching it once the cached copy expires.
 
-        async def check_model(model_name: str) -> tuple[str, bool]:
-            async with semaphore:
-                usable = await self._is_model_usable(model_name)
-                return model_name, usable
+        Returns:
+            Tuple of (recommended_models, other_models) lists.
+        """
+        if self._models_cache is None or time.monotonic() >= self._models_cache[0]:
+            async with self._models_fetch_lock:
+                # Another caller may have refreshed the list while we waited
+                if self._models_cache is None or time.monotonic() >= self._models_cache[0]:
+                    await self._fetch_models_to_cache()
+        _, recommended, other_models = self._models_cache
+        return recommended, other_models
 
-        tasks = [check_model(m) for m in all_models]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+    @staticmethod
+    def _render_model_list_fields(recommended: list[str], other_models: list[str]) -> tuple[str, str]:
+        """Render the /gem model list embed field values.
 
-        for result in results:
-            if isinstance(result, Exception):
-                continue
-            model_name, usable = result
-            if usable:
-                usable_models.append(model_name)
+        Args:
+            recommended: Recommended model names.
+            other_models: Other model names.
 
-        self.bot.recommended_models = [m for m in recommended if m in usable_models]
-        self.bot.available_models = usable_models
+        Returns:
+            Tuple of (recommended_value, other_value) bullet lists; only the
+            first 20 other models are listed to stay within embed limits.
+        """
+        recommended_value = "\n".join(f"• {name}" for name in recommended)
+        other_value = "\n".join(f"• {name}" for name in other_models[:20])
+        if len(other_models) > 20:
+            other_value += f"\n... and {len(other_models) - 20} more"
+        return recommended_value, other_value
 
     def _get_message_preview(self, msg, max_length: int = 50) -> str:
         """Extract and truncate message content for preview.
@@ -123,28 +246,36 @@ class Commands(commands.Cog):
         Returns:
             Truncated message preview string.
         """
-        content = ""
-        if msg.parts:
-            for part in msg.parts:
-                if hasattr(part, "text") and part.text:
-                    content = part.text
-                    break
+        content = next(
+            (part.text for part in msg.parts or () if getattr(part, "text", None)), ""
+        )
 
         # Truncate and clean
         preview = content[:max_length] + "..." if len(content) > max_length else content
-        return preview.replace("\n", " ")
+        return preview.translate(self._NEWLINE_TO_SPACE)
 
     def _get_calendar_auth(self) -> CalendarAuthManager | None:
         """Get the calendar auth manager from bot, or None if not available."""
-        if hasattr(self.bot, "calendar_auth") and self.bot.calendar_auth is not None:
-            return self.bot.calendar_auth
-        return None
+        return self.bot.calendar_auth
+
+    def _get_setup_check_auth(self) -> CalendarAuthManager:
+        """Get a manager for checking credentials.json configuration status.
+
+        Uses the bot's manager when Google integration is enabled; otherwise
+        a standalone manager is created once and kept, so its cached
+        configuration status is reused across setup guide requests.
+        """
+        auth_manager = self._get_calendar_auth()
+        if auth_manager is not None:
+            return auth_manager
+        if self._setup_check_auth is None:
+            self._setup_check_auth = CalendarAuthManager()
+        return self._setup_check_auth
     
     async def _send_google_setup_guide(self, interaction: discord.Interaction) -> None:
         """Send a helpful setup guide when credentials.json is missing or invalid."""
-        # Create a temporary manager just to check configuration status
-        temp_manager = CalendarAuthManager()
-        config_status = temp_manager.get_configuration_status()
+        auth_manager = self._get_setup_check_auth()
+        config_status = auth_manager.get_configuration_status()
 
         error_code = config_status.get("error_code", "unknown")
         setup_url = config_status.get("setup_url", "https://console.cloud.google.com/apis/credentials")
@@ -156,14 +287,9 @@ class Commands(commands.Cog):
         )
 
         # Error-specific message
-        if error_code == "file_not_found":
-            embed.description = self.t("google_setup_file_not_found")
-        elif error_code == "invalid_json":
-            embed.description = self.t("google_setup_invalid_json")
-        elif error_code == "missing_installed":
-            embed.description = self.t("google_setup_wrong_format")
-        elif error_code in ("missing_client_id", "missing_client_secret"):
-            embed.description = self.t("google_setup_missing_fields")
+        message_key = self.GOOGLE_SETUP_ERROR_KEYS.get(error_code)
+        if message_key:
+            embed.description = self.t(message_key)
         else:
             embed.description = self.t("google_setup_unknown_error", message=config_status.get("message", ""))
 
@@ -183,44 +309,132 @@ class Commands(commands.Cog):
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
+    @staticmethod
+    def _render_export_body(messages: list[dict]) -> str:
+        """Render the conversation section of a Markdown export.
+
+        Args:
+            messages: Saved conversation messages.
+
+        Returns:
+            Markdown for the messages.
+        """
+        lines = []
+        for msg in messages:
+            role = msg.get("role", "unknown").capitalize()
+            content = msg.get("content", "")
+            timestamp = msg.get("timestamp", "")
+            if timestamp:
+                try:
+                    dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+                    timestamp = dt.strftime("%Y-%m-%d %H:%M:%S")
+                except Exception:
+                    pass
+            lines.append(f"### {role} ({timestamp})")
+            lines.append("")
+            if "images" in msg:
+                for image_path in msg["images"]:
+                    lines.append(f"![image]({image_path})")
+                    lines.append("")
+            lines.append(content)
+            lines.append("")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _build_export_zip(
+        md_content: str,
+        thought_signature: bytes | None,
+        images: dict[str, tuple[bytes, str] | None],
+    ) -> tempfile.SpooledTemporaryFile:
+        """Build a history export ZIP (blocking; run it in a worker thread).
+
+        Args:
+            md_content: Rendered conversation Markdown.
+            thought_signature: Thought signature to include, if any.
+            images: Loaded image data and MIME type keyed by relative path
+                (None for images missing on disk).
+
+        Returns:
+            Spooled file holding the archive, rewound to the start.
+        """
+        zip_buffer = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_SIZE)
+        with zipfile.ZipFile(
+            zip_buffer, "w", zipfile.ZIP_DEFLATED, allowZip64=True, compresslevel=EXPORT_COMPRESS_LEVEL
+        ) as zf:
+            zf.writestr("conversation.md", md_content.encode("utf-8"))
+
+            # Export thought signature if exists
+            if thought_signature:
+                zf.writestr("thought_signature.txt", base64.b64encode(thought_signature))
+
+            for image_path, image_data in images.items():
+                if image_data:
+                    data_bytes, mime_type = image_data
+                    compress_type = (
+                        zipfile.ZIP_STORED
+                        if mime_type in PRECOMPRESSED_MIME_TYPES
+                        else zipfile.ZIP_DEFLATED
+                    )
+                    zf.writestr(image_path, data_bytes, compress_type=compress_type)
+
+        zip_buffer.seek(0)
+        return zip_buffer
+
     # =========================================================================
     # Autocomplete Handlers
     # =========================================================================
 
+    def _get_model_choices(self) -> _ChoiceIndex:
+        """Get the model autocomplete index, rebuilding it if the models changed."""
+        ordered_models = self.bot.ordered_models
+        cache = self._model_choice_cache
+        if cache is not None and cache[0] is ordered_models:
+            return cache[1]
+
+        choices = _ChoiceIndex(ordered_models)
+        self._model_choice_cache = (ordered_models, choices)
+        return choices
+
     async def model_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
         """Autocomplete for model selection."""
-        if not self.bot.available_models:
+        if not self.bot.ordered_models:
             return []
 
-        all_models = self.bot.recommended_models + [
-            m for m in self.bot.available_models if m not in self.bot.recommended_models
-        ]
-
-        return [
-            app_commands.Choice(name=model, value=model)
-            for model in all_models
-            if current.lower() in model.lower()
-        ][:25]
+        return self._get_model_choices().match(current)
 
     async def branch_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
         """Autocomplete for branch selection."""
         channel_id = interaction.channel_id
-        branches = self.bot.history_manager.list_branches(channel_id)
-        
-        return [
-            app_commands.Choice(name=branch, value=branch)
-            for branch in branches
-            if current.lower() in branch.lower()
-        ][:25]
+        branches = self.bot.history_manager.get_branch_names(channel_id)
+        cached = self._branch_choice_cache.get(channel_id)
+        if cached is None or cached[0] != branches:
+            cached = (branches, _ChoiceIndex(sorted(branches)))
+            self._branch_choice_cache[channel_id] = cached
+
+        return cached[1].match(current)
 
     async def config_key_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
         """Autocomplete for config keys."""
-        schema = self.bot.history_manager.GENERATION_CONFIG_SCHEMA
-        return [
-            app_commands.Choice(name=key, value=key)
-            for key in schema.keys()
-            if current.lower() in key.lower()
-        ][:25]
+        return self._config_key_choices.match(current)
+
+    @staticmethod
+    def _indices_with_prefix(prefix: str, count: int):
+        """Yield 1-based message indices up to count whose digits start with prefix.
+
+        Indices are produced in ascending order without scanning every
+        message: prefix "3" yields 3, 30-39, 300-399, and so on.
+        """
+        if not prefix:
+            yield from range(1, count + 1)
+            return
+        if not prefix.isdigit() or prefix.startswith("0"):
+            return
+
+        start, width = int(prefix), 1
+        while start <= count:
+            yield from range(start, min(start + width, count + 1))
+            start *= 10
+            width *= 10
 
     async def history_delete_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
         """Autocomplete for history delete - shows message previews."""
@@ -228,17 +442,15 @@ class Commands(commands.Cog):
         history = self.bot.conversation_history.get(channel_id, [])
 
         choices = []
-        for i, msg in enumerate(history):
-            index = i + 1
-            if current and not str(index).startswith(current):
-                continue
+        for index in itertools.islice(self._indices_with_prefix(current, len(history)), 25):
+            msg = history[index - 1]
             role = msg.role.upper()
             preview = self._get_message_preview(msg, max_length=40)
             choices.append(
                 app_commands.Choice(name=f"{index}. [{role}] {preview}", value=str(index))
             )
 
-        return choices[:25]
+        return choices
 
     # =========================================================================
     # Slash Commands Group: /gem
@@ -314,20 +526,15 @@ class Commands(commands.Cog):
             image_mime = None
 
             for part in response.candidates[0].content.parts:
-                if hasattr(part, "text") and part.text:
-                    text_response = part.text
-                if hasattr(part, "inline_data") and part.inline_data:
-                    image_data = part.inline_data.data
-                    image_mime = part.inline_data.mime_type
+                if text := getattr(part, "text", None):
+                    text_response = text
+                if inline_data := getattr(part, "inline_data", None):
+                    image_data = inline_data.data
+                    image_mime = inline_data.mime_type
 
             if image_data:
                 # Determine file extension from mime type
-                ext = "png"
-                if image_mime:
-                    if "jpeg" in image_mime or "jpg" in image_mime:
-                        ext = "jpg"
-                    elif "webp" in image_mime:
-                        ext = "webp"
+                ext = IMAGE_MIME_TO_EXT.get((image_mime or "").lower(), "png")
 
                 # Create discord.File from image data
                 file = discord.File(
@@ -356,7 +563,8 @@ class Commands(commands.Cog):
         await interaction.response.defer()
         
         try:
-            recommended, other_models = await self._fetch_and_sort_models()
+            recommended, other_models = await self._get_sorted_models()
+            recommended_value, other_value = self._model_list_fields
             current_model = self.bot.get_model(interaction.channel_id)
             total_count = len(recommended) + len(other_models)
 
@@ -370,25 +578,34 @@ class Commands(commands.Cog):
             if recommended:
                 embed.add_field(
                     name=self.t("model_list_recommended"),
-                    value="\n".join(f"• {name}" for name in recommended),
+                    value=recommended_value,
                     inline=False,
                 )
 
-            # Add other models in chunks (simplified for slash command embed)
+            # Add other models (rendered once per model list fetch)
             if other_models:
-                # Just show first 20 other models to avoid hit limits
-                chunk = other_models[:20]
-                value = "\n".join(f"• {name}" for name in chunk)
-                if len(other_models) > 20:
-                    value += f"\n... and {len(other_models) - 20} more"
-                
-                embed.add_field(name=self.t("model_list_field"), value=value, inline=False)
+                embed.add_field(name=self.t("model_list_field"), value=other_value, inline=False)
 
             embed.set_footer(text=self.t("model_list_footer", count=total_count))
             await interaction.followup.send(embed=embed)
         except Exception as e:
             await interaction.followup.send(self.t("model_list_error", error=e))
 
+    @model_group.command(name="refresh")
+    async def model_refresh(self, interaction: discord.Interaction):
+        """Refetch the model list, bypassing the cached copy."""
+        await interaction.response.defer(ephemeral=True)
+
+        try:
+            await self._fetch_models_to_cache()
+            _, recommended, other_models = self._models_cache
+            await interaction.followup.send(
+                self.t("model_refresh_done", count=len(recommended) + len(other_models)),
+                ephemeral=True,
+            )
+        except Exception as e:
+            await interaction.followup.send(self.t("model_list_error", error=e), ephemeral=True)
+
     @model_group.command(name="set")
     @app_commands.describe(model="The model to use")
     @app_commands.autocomplete(model=model_autocomplete)
@@ -433,8 +650,9 @@ class Commands(commands.Cog):
             end_index = min(start_index + count, total)
             shown_messages = history[start_index:end_index]
 
+            title = self.t("history_list_title")
             embed = discord.Embed(
-                title=self.t("history_list_title"),
+                title=title,
                 color=discord.Color.blue(),
             )
 
@@ -451,7 +669,7 @@ class Commands(commands.Cog):
                 chunk = lines[i : i + chunk_size]
                 field_name = (
                     "\u200b" if i == 0
-                    else f"{self.t('history_list_title')} ({i // chunk_size + 1})"
+                    else f"{title} ({i // chunk_size + 1})"
                 )
                 embed.add_field(name=field_name, value="\n".join(chunk), inline=False)
 
@@ -486,25 +704,24 @@ class Commands(commands.Cog):
                 await interaction.response.send_message(self.t("history_delete_not_found", index=index_int))
                 return
             
-            # Calculate what to delete (logic copied from original)
+            # Calculate what to delete: the message plus its user/model pair,
+            # which is always adjacent, so the range is contiguous
             target_msg = history[idx]
-            indices_to_delete = [idx]
+            start, end = idx, idx + 1
             if target_msg.role == "user":
                  if idx + 1 < len(history) and history[idx + 1].role == "model":
-                    indices_to_delete.append(idx + 1)
+                    end += 1
             elif target_msg.role == "model":
                 if idx - 1 >= 0 and history[idx - 1].role == "user":
-                    indices_to_delete.insert(0, idx - 1)
+                    start -= 1
             
             # Perform deletion
-            sorted_indices = sorted(indices_to_delete, reverse=True)
-            for i in sorted_indices:
-                history.pop(i)
+            del history[start:end]
                 
-            self.bot._save_history_to_disk(channel_id)
+            await self.bot._save_history_to_disk_async(channel_id)
             
             await interaction.response.send_message(
-                 self.t("history_delete_success", count=len(indices_to_delete))
+                 self.t("history_delete_success", count=end - start)
             )
         except Exception as e:
             await interaction.response.send_message(self.t("history_error", error=e))
@@ -514,7 +731,8 @@ class Commands(commands.Cog):
         """Clear all conversation history from memory for this channel."""
         channel_id = interaction.channel_id
         try:
-            self.bot.history_manager.clear_conversation(channel_id)
+            async with self.bot.history_lock(channel_id):
+                await asyncio.to_thread(self.bot.history_manager.clear_conversation, channel_id)
             self.bot.conversation_history[channel_id] = []
             await interaction.response.send_message(self.t("history_cleared"))
         except Exception as e:
@@ -528,14 +746,15 @@ class Commands(commands.Cog):
         channel_id = interaction.channel_id
 
         try:
-            data = self.bot.history_manager.load_conversation(channel_id)
+            history_manager = self.bot.history_manager
+            data = await asyncio.to_thread(history_manager.load_conversation, channel_id)
             if not data or not data.get("messages"):
                 await interaction.followup.send(self.t("history_export_empty"))
                 return
 
-            branch = self.bot.history_manager.get_current_branch(channel_id)
+            branch = await asyncio.to_thread(history_manager.get_current_branch, channel_id)
             if filename is None:
-                timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+                timestamp = local_timestamp("%Y%m%d%H%M%S")
                 filename = f"{channel_id}_{branch}_{timestamp}"
 
             # Check for images
@@ -544,78 +763,43 @@ class Commands(commands.Cog):
                 for msg in data.get("messages", [])
             )
             
-            # Helper to build MD (copied logic)
-            def build_md(data, channel_id, branch):
-                lines = [
-                    "# Conversation Export", "",
-                    f"- **Channel ID**: {channel_id}",
-                    f"- **Branch**: {branch}",
-                    f"- **Model**: {data.get('model', 'N/A')}",
-                    f"- **Exported at**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-                    "", "---", "", "## Conversation", ""
-                ]
-                for msg in data.get("messages", []):
-                    role = msg.get("role", "unknown").capitalize()
-                    content = msg.get("content", "")
-                    timestamp = msg.get("timestamp", "")
-                    if timestamp:
-                        try:
-                            dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                            timestamp = dt.strftime("%Y-%m-%d %H:%M:%S")
-                        except Exception:
-                            pass
-                    lines.append(f"### {role} ({timestamp})")
-                    lines.append("")
-                    if "images" in msg:
-                        for image_path in msg["images"]:
-                            lines.append(f"![image]({image_path})")
-                            lines.append("")
-                    lines.append(content)
-                    lines.append("")
-                return "\n".join(lines)
-
-            if has_images:
-                zip_buffer = io.BytesIO()
-                with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-                    md_content = build_md(data, channel_id, branch)
-                    zf.writestr("conversation.md", md_content.encode("utf-8"))
-
-                    # Export thought signature if exists
-                    thought_signature = self.bot.history_manager.load_thought_signature(channel_id)
-                    if thought_signature:
-                        signature_b64 = base64.b64encode(thought_signature).decode("utf-8")
-                        zf.writestr("thought_signature.txt", signature_b64.encode("utf-8"))
-
-                    for msg in data.get("messages", []):
-                        if "images" in msg:
-                            for image_path in msg["images"]:
-                                image_data = self.bot.history_manager.load_image(
-                                    channel_id, image_path
-                                )
-                                if image_data:
-                                    zf.writestr(image_path, image_data[0])
-
-                zip_buffer.seek(0)
+            md_content = "\n".join([
+                "# Conversation Export", "",
+                f"- **Channel ID**: {channel_id}",
+                f"- **Branch**: {branch}",
+                f"- **Model**: {data.get('model', 'N/A')}",
+                f"- **Exported at**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                "", "---", "", "## Conversation", "",
+                self._render_export_body(data.get("messages", [])),
+            ])
+            thought_signature = await asyncio.to_thread(
+                history_manager.load_thought_signature, channel_id
+            )
+
+            # Zip when there are images or a thought signature to include
+            if has_images or thought_signature:
+                # Read all images concurrently rather than one after another
+                image_paths = list(dict.fromkeys(
+                    image_path
+                    for msg in data.get("messages", [])
+                    for image_path in msg.get("images", [])
+                ))
+                image_data = await asyncio.gather(*(
+                    asyncio.to_thread(history_manager.load_image, channel_id, image_path)
+                    for image_path in image_paths
+                ))
+                zip_buffer = await asyncio.to_thread(
+                    self._build_export_zip,
+                    md_content,
+                    thought_signature,
+                    dict(zip(image_paths, image_data)),
+                )
                 file = discord.File(zip_buffer, filename=f"{filename}.zip")
             else:
-                # Export thought signature if exists (even without images)
-                thought_signature = self.bot.history_manager.load_thought_signature(channel_id)
-                if thought_signature:
-                    zip_buffer = io.BytesIO()
-                    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-                        md_content = build_md(data, channel_id, branch)
-                        zf.writestr("conversation.md", md_content.encode("utf-8"))
-                        signature_b64 = base64.b64encode(thought_signature).decode("utf-8")
-                        zf.writestr("thought_signature.txt", signature_b64.encode("utf-8"))
-
-                    zip_buffer.seek(0)
-                    file = discord.File(zip_buffer, filename=f"{filename}.zip")
-                else:
-                    md_content = build_md(data, channel_id, branch)
-                    file = discord.File(
-                        io.BytesIO(md_content.encode("utf-8")),
-                        filename=f"{filename}.md",
-                    )
+                file = discord.File(
+                    io.BytesIO(md_content.encode("utf-8")),
+                    filename=f"{filename}.md",
+                )
 
             await interaction.followup.send(self.t("history_export_success"), file=file)
         except Exception as e:
@@ -635,16 +819,15 @@ class Commands(commands.Cog):
                 await interaction.response.send_message(self.t("branch_list_empty"))
                 return
 
-            branch_lines = []
-            for b in branches:
-                if b == current:
-                    branch_lines.append(f"• **{b}** {self.t('branch_list_current')}")
-                else:
-                    branch_lines.append(f"• {b}")
+            current_label = self.t("branch_list_current")
+            description = "\n".join(
+                f"• **{b}** {current_label}" if b == current else f"• {b}"
+                for b in branches
+            )
 
             embed = discord.Embed(
                 title=self.t("branch_list_title"),
-                description="\n".join(branch_lines),
+                description=description,
                 color=discord.Color.blue(),
             )
             await interaction.response.send_message(embed=embed)
@@ -655,28 +838,33 @@ class Commands(commands.Cog):
     @app_commands.describe(name="Name of the new branch")
     async def branch_create(self, interaction: discord.Interaction, name: str):
         """Create a new branch from current conversation and switch to it."""
+        await interaction.response.defer()
         channel_id = interaction.channel_id
+        history_manager = self.bot.history_manager
         try:
-            self.bot.history_manager.commit(channel_id, "Auto-save before branch")
-            self.bot.history_manager.create_branch(channel_id, name, switch=True)
-            self.bot._reload_history_from_disk(channel_id)
-            await interaction.response.send_message(self.t("branch_created", branch=name))
+            async with self.bot.history_lock(channel_id):
+                if history_manager.is_dirty(channel_id):
+                    await asyncio.to_thread(history_manager.commit, channel_id, "Auto-save before branch")
+                await asyncio.to_thread(history_manager.create_branch, channel_id, name, switch=True)
+                await self.bot._reload_history_from_disk_async(channel_id)
+            await interaction.followup.send(self.t("branch_created", branch=name))
         except Exception as e:
-            await interaction.response.send_message(self.t("branch_error", error=e))
+            await interaction.followup.send(self.t("branch_error", error=e))
 
     @branch_group.command(name="switch")
     @app_commands.describe(branch="Branch to switch to")
     @app_commands.autocomplete(branch=branch_autocomplete)
     async def branch_switch(self, interaction: discord.Interaction, branch: str):
         """Switch to a different branch."""
+        await interaction.response.defer()
         channel_id = interaction.channel_id
         try:
-            # Check existence first? switch_branch might throw error if not exists
-            self.bot.history_manager.switch_branch(channel_id, branch)
-            self.bot._reload_history_from_disk(channel_id)
-            await interaction.response.send_message(self.t("branch_switched", branch=branch))
+            async with self.bot.history_lock(channel_id):
+                await asyncio.to_thread(self.bot.history_manager.switch_branch, channel_id, branch)
+                await self.bot._reload_history_from_disk_async(channel_id)
+            await interaction.followup.send(self.t("branch_switched", branch=branch))
         except Exception as e:
-            await interaction.response.send_message(self.t("branch_error", error=e))
+            await interaction.followup.send(self.t("branch_error", error=e))
 
     @branch_group.command(name="delete")
     @app_commands.describe(branch="Branch to delete")
@@ -685,7 +873,8 @@ class Commands(commands.Cog):
         """Delete a branch."""
         channel_id = interaction.channel_id
         try:
-            self.bot.history_manager.delete_branch(channel_id, branch)
+            async with self.bot.history_lock(channel_id):
+                await asyncio.to_thread(self.bot.history_manager.delete_branch, channel_id, branch)
             await interaction.response.send_message(self.t("branch_deleted", branch=branch))
         except Exception as e:
             await interaction.response.send_message(self.t("branch_error", error=e))
@@ -695,20 +884,24 @@ class Commands(commands.Cog):
     @app_commands.autocomplete(branch=branch_autocomplete)
     async def branch_merge(self, interaction: discord.Interaction, branch: str):
         """Merge another branch into the current branch."""
+        await interaction.response.defer()
         channel_id = interaction.channel_id
+        history_manager = self.bot.history_manager
         try:
-            self.bot.history_manager.commit(channel_id, "Auto-save before merge")
-            merged_count = self.bot.history_manager.merge_branch(channel_id, branch)
-            self.bot._reload_history_from_disk(channel_id)
+            async with self.bot.history_lock(channel_id):
+                if history_manager.is_dirty(channel_id):
+                    await asyncio.to_thread(history_manager.commit, channel_id, "Auto-save before merge")
+                merged_count = await asyncio.to_thread(history_manager.merge_branch, channel_id, branch)
+                await self.bot._reload_history_from_disk_async(channel_id)
             
             if merged_count > 0:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     self.t("branch_merged", branch=branch, count=merged_count)
                 )
             else:
-                await interaction.response.send_message(self.t("branch_merge_nothing"))
+                await interaction.followup.send(self.t("branch_merge_nothing"))
         except Exception as e:
-            await interaction.response.send_message(self.t("branch_error", error=e))
+            await interaction.followup.send(self.t("branch_error", error=e))
 
     @branch_group.command(name="rename")
     @app_commands.describe(new_name="New name for the current branch")
@@ -716,8 +909,9 @@ class Commands(commands.Cog):
         """Rename current branch."""
         channel_id = interaction.channel_id
         try:
-            old_name = self.bot.history_manager.get_current_branch(channel_id)
-            self.bot.history_manager.rename_branch(channel_id, new_name)
+            async with self.bot.history_lock(channel_id):
+                old_name = await asyncio.to_thread(self.bot.history_manager.get_current_branch, channel_id)
+                await asyncio.to_thread(self.bot.history_manager.rename_branch, channel_id, new_name)
             await interaction.response.send_message(
                 self.t("branch_renamed", old=old_name, new=new_name)
             )
@@ -740,7 +934,7 @@ class Commands(commands.Cog):
         selected_mode = mode.value
 
         # Check authentication for calendar/todo
-        if selected_mode in ("calendar", "todo"):
+        if selected_mode in AUTH_REQUIRED_MODES:
             calendar_auth = self._get_calendar_auth()
             
             if calendar_auth is None:
@@ -764,33 +958,29 @@ class Commands(commands.Cog):
     @config_group.command(name="show")
     async def config_show(self, interaction: discord.Interaction):
         """Show current generation config."""
+        await interaction.response.defer()
         channel_id = interaction.channel_id
         try:
             gen_config = self.bot.history_manager.load_generation_config(channel_id)
-            schema = self.bot.history_manager.GENERATION_CONFIG_SCHEMA
+            default_label = self.t("config_default")
             
             embed = discord.Embed(
                 title=self.t("config_show_title"),
                 color=discord.Color.blue(),
             )
             
-            for key, key_schema in schema.items():
-                if key in gen_config:
-                    value = gen_config[key]
-                    status = f"**{value}**"
-                else:
-                    status = self.t("config_default")
-                
-                range_info = f"({key_schema['min']} - {key_schema['max']})"
+            for key, field_name in self._config_fields:
+                value = gen_config.get(key)
+                status = default_label if value is None else f"**{value}**"
                 embed.add_field(
-                    name=f"{key} {range_info}",
+                    name=field_name,
                     value=status,
                     inline=True
                 )
             
-            await interaction.response.send_message(embed=embed)
+            await interaction.followup.send(embed=embed)
         except Exception as e:
-             await interaction.response.send_message(self.t("config_error", error=e))
+             await interaction.followup.send(self.t("config_error", error=e))
 
     @config_group.command(name="set")
     @app_commands.describe(key="Config key", value="Value to set")
@@ -805,6 +995,9 @@ class Commands(commands.Cog):
             await interaction.response.send_message(
                 self.t("config_set_success", config_key=key, config_value=value)
             )
+        except ValueError as e:
+            # Invalid key or value; the message is already translated
+            await interaction.response.send_message(str(e), ephemeral=True)
         except Exception as e:
              await interaction.response.send_message(self.t("config_error", error=e))
 
@@ -830,12 +1023,13 @@ class Commands(commands.Cog):
     @system_prompt_group.command(name="show")
     async def prompt_system_show(self, interaction: discord.Interaction):
         """Show the current master system prompt."""
+        await interaction.response.defer()
         try:
             master_path = self.bot.history_manager.get_master_prompt_path()
-            content = master_path.read_text(encoding="utf-8") if master_path.exists() else ""
+            content = await asyncio.to_thread(_read_text_or_empty, master_path)
             
             if not content.strip():
-                await interaction.response.send_message(self.t("prompt_show_empty"))
+                await interaction.followup.send(self.t("prompt_show_empty"))
                 return
 
             if len(content) <= 1900:
@@ -844,30 +1038,27 @@ class Commands(commands.Cog):
                     description=f"```\n{content}\n```",
                     color=discord.Color.blue(),
                 )
-                await interaction.response.send_message(embed=embed)
+                await interaction.followup.send(embed=embed)
             else:
-                await interaction.response.send_message(self.t("prompt_show_title"))
-                chunks = [content[i : i + 1900] for i in range(0, len(content), 1900)]
-                for chunk in chunks:
-                    await interaction.followup.send(f"```\n{chunk}\n```")
+                # Too long for one message: attach the file in a single request
+                file = discord.File(master_path, filename="GEMINI.md")
+                await interaction.followup.send(self.t("prompt_show_title"), file=file)
         except Exception as e:
-            await interaction.response.send_message(self.t("prompt_error", error=e))
+            await interaction.followup.send(self.t("prompt_error", error=e))
 
     @system_prompt_group.command(name="download")
     async def prompt_system_download(self, interaction: discord.Interaction):
         """Download the current master system prompt as a file."""
         try:
             master_path = self.bot.history_manager.get_master_prompt_path()
-            content = master_path.read_text(encoding="utf-8") if master_path.exists() else ""
+            content = await asyncio.to_thread(_read_text_or_empty, master_path)
 
             if not content.strip():
                 await interaction.response.send_message(self.t("prompt_download_empty"))
                 return
 
-            file = discord.File(
-                io.BytesIO(content.encode("utf-8")),
-                filename="GEMINI.md",
-            )
+            # Let discord.py stream the file instead of re-encoding the text
+            file = discord.File(master_path, filename="GEMINI.md")
             await interaction.response.send_message(self.t("prompt_download_success"), file=file)
         except Exception as e:
             await interaction.response.send_message(self.t("prompt_error", error=e))
@@ -877,11 +1068,14 @@ class Commands(commands.Cog):
     @channel_prompt_group.command(name="show")
     async def prompt_channel_show(self, interaction: discord.Interaction):
         """Show the current channel instruction."""
+        await interaction.response.defer()
         channel_id = interaction.channel_id
         try:
-            content = self.bot.history_manager.load_channel_prompt(channel_id)
+            content = await asyncio.to_thread(
+                self.bot.history_manager.load_channel_prompt, channel_id
+            )
             if not content.strip():
-                await interaction.response.send_message(self.t("channel_prompt_show_empty"))
+                await interaction.followup.send(self.t("channel_prompt_show_empty"))
                 return
 
             if len(content) <= 1900:
@@ -890,27 +1084,32 @@ class Commands(commands.Cog):
                     description=f"```\n{content}\n```",
                     color=discord.Color.blue(),
                 )
-                await interaction.response.send_message(embed=embed)
+                await interaction.followup.send(embed=embed)
             else:
-                await interaction.response.send_message(self.t("channel_prompt_show_title"))
-                chunks = [content[i : i + 1900] for i in range(0, len(content), 1900)]
-                for chunk in chunks:
-                    await interaction.followup.send(f"```\n{chunk}\n```")
+                # Too long for one message: attach the file in a single request
+                file = discord.File(
+                    self.bot.history_manager.get_channel_prompt_path(channel_id),
+                    filename="channel_instruction.md",
+                )
+                await interaction.followup.send(self.t("channel_prompt_show_title"), file=file)
         except Exception as e:
-             await interaction.response.send_message(self.t("channel_prompt_error", error=e))
+             await interaction.followup.send(self.t("channel_prompt_error", error=e))
 
     @channel_prompt_group.command(name="download")
     async def prompt_channel_download(self, interaction: discord.Interaction):
         """Download the current channel instruction as a file."""
         channel_id = interaction.channel_id
         try:
-            content = self.bot.history_manager.load_channel_prompt(channel_id)
+            content = await asyncio.to_thread(
+                self.bot.history_manager.load_channel_prompt, channel_id
+            )
             if not content.strip():
                 await interaction.response.send_message(self.t("channel_prompt_download_empty"))
                 return
 
+            # Let discord.py stream the file instead of re-encoding the text
             file = discord.File(
-                io.BytesIO(content.encode("utf-8")),
+                self.bot.history_manager.get_channel_prompt_path(channel_id),
                 filename="channel_instruction.md",
             )
             await interaction.response.send_message(self.t("channel_prompt_download_success"), file=file)
@@ -922,7 +1121,8 @@ class Commands(commands.Cog):
         """Clear the channel instruction."""
         channel_id = interaction.channel_id
         try:
-            self.bot.history_manager.save_system_prompt(channel_id, "")
+            async with self.bot.history_lock(channel_id):
+                await asyncio.to_thread(self.bot.history_manager.save_system_prompt, channel_id, "")
             await interaction.response.send_message(self.t("channel_prompt_clear_success"))
         except Exception as e:
             await interaction.response.send_message(self.t("channel_prompt_error", error=e))
@@ -940,11 +1140,12 @@ class Commands(commands.Cog):
             await self._send_google_setup_guide(interaction)
             return
 
-        if not calendar_auth.is_credentials_configured():
+        status = calendar_auth.get_auth_status(user_id)
+        if not status["credentials_configured"]:
             await self._send_google_setup_guide(interaction)
             return
 
-        if calendar_auth.is_user_authenticated(user_id):
+        if status["authenticated"]:
             await interaction.response.send_message(self.t("google_already_linked"), ephemeral=True)
             return
 
@@ -999,12 +1200,15 @@ class Commands(commands.Cog):
         user_id = interaction.user.id
         calendar_auth = self._get_calendar_auth()
 
-        if calendar_auth is None or not calendar_auth.is_credentials_configured():
+        if calendar_auth is None:
             await self._send_google_setup_guide(interaction)
             return
 
         status = calendar_auth.get_auth_status(user_id)
-        
+        if not status["credentials_configured"]:
+            await self._send_google_setup_guide(interaction)
+            return
+
         if status["authenticated"]:
             embed = discord.Embed(
                 title=self.t("google_status_title"),
@@ -1042,9 +1246,8 @@ class Commands(commands.Cog):
             await interaction.followup.send(self.t("thought_signature_not_found"))
             return
 
-        signature_b64 = base64.b64encode(thought_signature).decode("utf-8")
         file = discord.File(
-            io.BytesIO(signature_b64.encode("utf-8")),
+            io.BytesIO(base64.b64encode(thought_signature)),
             filename="thought_signature.txt"
         )
         await interaction.followup.send(self.t("thought_signature_download_success"), file=file)
@@ -1058,8 +1261,8 @@ class Commands(commands.Cog):
 
         try:
             content = await file.read()
-            signature_b64 = content.decode("utf-8").strip()
-            signature = base64.b64decode(signature_b64)
+            # b64decode takes bytes directly; no need to decode as UTF-8 first
+            signature = base64.b64decode(content.strip())
             self.bot.history_manager.save_thought_signature(channel_id, signature)
             await interaction.followup.send(self.t("thought_signature_upload_success"))
         except Exception as e:
@@ -12,6 +12,7 @@ from __future__ import annotations
 import base64
 import json
 import subprocess
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -20,6 +21,30 @@ if TYPE_CHECKING:
     from i18n import I18nManager
 
 
+# Last (epoch second, format, formatted string) produced by local_timestamp()
+_timestamp_cache: tuple[int, str, str] = (-1, "", "")
+
+
+def local_timestamp(fmt: str) -> str:
+    """Format the current local time, reusing the result within the same second.
+
+    Args:
+        fmt: strftime format string (second granularity at most).
+
+    Returns:
+        Formatted local timestamp.
+    """
+    global _timestamp_cache
+    now = int(time.time())
+    cached_sec, cached_fmt, cached_str = _timestamp_cache
+    if now == cached_sec and fmt == cached_fmt:
+        return cached_str
+
+    formatted = time.strftime(fmt, time.localtime(now))
+    _timestamp_cache = (now, fmt, formatted)
+    return formatted
+
+
 class HistoryManager:
     """Manages conversation history with Git version control.
 
@@ -37,6 +62,16 @@ class HistoryManager:
         self.base_dir.mkdir(parents=True, exist_ok=True)
         self.i18n = i18n
 
+        # Per-channel count of writes made through this manager, and the count
+        # as of the last commit that left the working tree clean. A channel is
+        # known clean only while the two match.
+        self._write_generation: dict[int, int] = {}
+        self._clean_generation: dict[int, int] = {}
+
+        # Per-channel branch names, filled by list_branches and kept in step
+        # by the branch operations below.
+        self._branch_index: dict[int, set[str]] = {}
+
     def t(self, key: str, **kwargs) -> str:
         """Get translated string.
 
@@ -115,7 +150,7 @@ class HistoryManager:
         ext = self.MIME_TO_EXT.get(mime_type, ".bin")
 
         # Generate unique filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = local_timestamp("%Y%m%d_%H%M%S")
         base_name = f"img_{timestamp}"
 
         # Find unique filename with counter
@@ -129,6 +164,7 @@ class HistoryManager:
 
         # Write image data
         file_path.write_bytes(image_data)
+        self._mark_dirty(channel_id)
 
         # Return relative path (from repo root)
         return f"files/{filename}"
@@ -254,9 +290,9 @@ class HistoryManager:
                 "messages": messages,
             }
 
-        # Write to file
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # Write to file in one call (json.dump issues a write() per token)
+        path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        self._mark_dirty(channel_id)
 
         if auto_commit:
             self.commit(channel_id, f"Update conversation")
@@ -283,6 +319,7 @@ class HistoryManager:
             }
             with open(path, "w", encoding="utf-8") as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
+            self._mark_dirty(channel_id)
 
             if auto_commit:
                 self.commit(channel_id, "Clear conversation history")
@@ -298,6 +335,7 @@ class HistoryManager:
             True if commit was made, False if nothing to commit.
         """
         self._ensure_repo(channel_id)
+        generation = self._write_generation.get(channel_id, 0)
 
         # Stage all changes
         self._git(channel_id, "add", "-A")
@@ -305,12 +343,33 @@ class HistoryManager:
         # Check if there are changes to commit
         result = self._git(channel_id, "status", "--porcelain", check=False)
         if not result.stdout.strip():
+            self._clean_generation[channel_id] = generation
             return False  # Nothing to commit
 
         # Commit
         self._git(channel_id, "commit", "-m", message)
+        self._clean_generation[channel_id] = generation
         return True
 
+    def _mark_dirty(self, channel_id: int) -> None:
+        """Record a write to the channel's working tree."""
+        self._write_generation[channel_id] = self._write_generation.get(channel_id, 0) + 1
+
+    def is_dirty(self, channel_id: int) -> bool:
+        """Check whether the channel may have uncommitted changes.
+
+        Only writes made through this manager are tracked, so a channel is
+        reported dirty until it has been committed at least once in this
+        process.
+
+        Args:
+            channel_id: Discord channel ID.
+
+        Returns:
+            False if the working tree is known to be clean, True otherwise.
+        """
+        return self._clean_generation.get(channel_id) != self._write_generation.get(channel_id, 0)
+
     def get_current_branch(self, channel_id: int) -> str:
         """Get the name of the current branch.
 
@@ -335,8 +394,39 @@ class HistoryManager:
         """
         self._ensure_repo(channel_id)
         result = self._git(channel_id, "branch", "--list", "--format=%(refname:short)")
-        branches = result.stdout.strip().split("\n")
-        return [b for b in branches if b]
+        branches = [b for b in result.stdout.strip().split("\n") if b]
+        # A fresh repo has no branch until its first commit creates one
+        # implicitly, so only index repos that already have history
+        if branches:
+            self._branch_index[channel_id] = set(branches)
+        return branches
+
+    def has_branch(self, channel_id: int, branch_name: str) -> bool:
+        """Check whether a branch exists.
+
+        Args:
+            channel_id: Discord channel ID.
+            branch_name: Branch name to look up.
+
+        Returns:
+            True if the branch exists, False otherwise.
+        """
+        if channel_id not in self._branch_index:
+            return branch_name in self.list_branches(channel_id)
+        return branch_name in self._branch_index[channel_id]
+
+    def get_branch_names(self, channel_id: int) -> frozenset[str]:
+        """Get the channel's branch names, from the branch index when possible.
+
+        Args:
+            channel_id: Discord channel ID.
+
+        Returns:
+            Set of branch names.
+        """
+        if channel_id not in self._branch_index:
+            return frozenset(self.list_branches(channel_id))
+        return frozenset(self._branch_index[channel_id])
 
     def create_branch(
         self, channel_id: int, branch_name: str, switch: bool = False
@@ -354,14 +444,14 @@ class HistoryManager:
         self._ensure_repo(channel_id)
 
         # Check if branch already exists
-        existing = self.list_branches(channel_id)
-        if branch_name in existing:
+        if self.has_branch(channel_id, branch_name):
             raise RuntimeError(self.t("history_branch_already_exists", branch=branch_name))
 
-        self._git(channel_id, "branch", branch_name)
-
         if switch:
-            self._git(channel_id, "checkout", branch_name)
+            self._git(channel_id, "checkout", "-b", branch_name)
+        else:
+            self._git(channel_id, "branch", branch_name)
+        self._branch_index.setdefault(channel_id, set()).add(branch_name)
 
     def switch_branch(self, channel_id: int, branch_name: str) -> None:
         """Switch to a different branch.
@@ -369,10 +459,16 @@ class HistoryManager:
         Args:
             channel_id: Discord channel ID.
             branch_name: Name of the branch to switch to.
+
+        Raises:
+            RuntimeError: If branch doesn't exist.
         """
         self._ensure_repo(channel_id)
+        if not self.has_branch(channel_id, branch_name):
+            raise RuntimeError(self.t("history_branch_not_found", branch=branch_name))
         # Commit any uncommitted changes first
-        self.commit(channel_id, "Auto-save before branch switch")
+        if self.is_dirty(channel_id):
+            self.commit(channel_id, "Auto-save before branch switch")
         self._git(channel_id, "checkout", branch_name)
 
     def delete_branch(self, channel_id: int, branch_name: str) -> None:
@@ -397,12 +493,12 @@ class HistoryManager:
             raise RuntimeError(self.t("history_cannot_delete_current"))
 
         # Check if branch exists
-        branches = self.list_branches(channel_id)
-        if branch_name not in branches:
+        if not self.has_branch(channel_id, branch_name):
             raise RuntimeError(self.t("history_branch_not_found", branch=branch_name))
 
         # Force delete the branch
         self._git(channel_id, "branch", "-D", branch_name)
+        self._branch_index.setdefault(channel_id, set()).discard(branch_name)
 
     def rename_branch(self, channel_id: int, new_name: str) -> None:
         """Rename current branch.
@@ -417,12 +513,15 @@ class HistoryManager:
         self._ensure_repo(channel_id)
 
         # Check if new name already exists
-        existing = self.list_branches(channel_id)
-        if new_name in existing:
+        if self.has_branch(channel_id, new_name):
             raise RuntimeError(self.t("history_branch_already_exists", branch=new_name))
 
         # Rename the current branch
+        current = self.get_current_branch(channel_id)
         self._git(channel_id, "branch", "-m", new_name)
+        if (branches := self._branch_index.get(channel_id)) is not None:
+            branches.discard(current)
+            branches.add(new_name)
 
     def merge_branch(
         self, channel_id: int, source_branch: str, auto_commit: bool = True
@@ -448,8 +547,7 @@ class HistoryManager:
         if source_branch == current_branch:
             raise RuntimeError(self.t("history_cannot_merge_current"))
 
-        branches = self.list_branches(channel_id)
-        if source_branch not in branches:
+        if not self.has_branch(channel_id, source_branch):
             raise RuntimeError(self.t("history_branch_not_found", branch=source_branch))
 
         # Load current branch messages
@@ -556,6 +654,7 @@ class HistoryManager:
             List of serializable message dicts.
         """
         messages = []
+        timestamp = datetime.now(timezone.utc).isoformat()
         for content in history:
             role = content.role
             # Extract text and images from parts
@@ -578,7 +677,7 @@ class HistoryManager:
             msg: dict[str, Any] = {
                 "role": role,
                 "content": "\n".join(text_parts),
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": timestamp,
             }
 
             if image_paths:
@@ -763,6 +862,7 @@ class HistoryManager:
         else:
             # Create empty file
             channel_path.write_text("", encoding="utf-8")
+            self._mark_dirty(channel_id)
             self.commit(channel_id, "Initialize empty channel instruction")
 
         # Combine
@@ -787,6 +887,7 @@ class HistoryManager:
         self._ensure_repo(channel_id)
         path = self.get_channel_prompt_path(channel_id)
         path.write_text(content, encoding="utf-8")
+        self._mark_dirty(channel_id)
 
         if auto_commit:
             self.commit(channel_id, "Update channel instruction")
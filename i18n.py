@@ -4,6 +4,7 @@ I18n Manager - Internationalization support for the bot.
 Manages language settings and translations with persistence in history/config.json.
 """
 
+import functools
 import json
 from pathlib import Path
 from typing import Any
@@ -40,6 +41,12 @@ class I18nManager:
         self._translations: dict[str, dict[str, str]] = {}
         self._load_translations()
 
+        # Memoized (language, key) -> template lookups, cleared on reload
+        self._template = functools.lru_cache(maxsize=512)(self._resolve_template)
+
+        # Bumped on every reload so caches built from translations can key on it
+        self.translations_version = 0
+
         # Load configuration (after translations so we can validate language)
         self._config = self._load_config()
 
@@ -129,6 +136,8 @@ class I18nManager:
         self._supported_languages = self._detect_languages()
         self._translations.clear()
         self._load_translations()
+        self._template.cache_clear()
+        self.translations_version += 1
 
         # Validate current language is still available
         if self.language not in self._supported_languages:
@@ -162,17 +171,16 @@ class I18nManager:
         self._config["language"] = value
         self._save_config()
 
-    def t(self, key: str, **kwargs) -> str:
-        """Get translated string.
+    def _resolve_template(self, lang: str, key: str) -> str:
+        """Find the untranslated template for a key.
 
         Args:
+            lang: Language code to look in first.
             key: Translation key.
-            **kwargs: Format arguments for the translated string.
 
         Returns:
-            Translated and formatted string.
+            Template string, or the key itself if no language defines it.
         """
-        lang = self.language
         translations = self._translations.get(lang, {})
 
         # Fallback to default language if key not found
@@ -180,7 +188,19 @@ class I18nManager:
             default_lang = self._get_default_language()
             translations = self._translations.get(default_lang, {})
 
-        text = translations.get(key, key)
+        return translations.get(key, key)
+
+    def t(self, key: str, **kwargs) -> str:
+        """Get translated string.
+
+        Args:
+            key: Translation key.
+            **kwargs: Format arguments for the translated string.
+
+        Returns:
+            Translated and formatted string.
+        """
+        text = self._template(self.language, key)
 
         # Format with provided arguments
         if kwargs:
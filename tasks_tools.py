@@ -4,22 +4,53 @@ This module defines the function declarations and handlers for
 Google Tasks integration with Gemini API.
 """
 
+import functools
+
 from google.genai import types
 
 from calendar_manager import CalendarAuthManager
+from calendar_tools import api_error_response
 from i18n import I18nManager
 
 
 def get_tasks_tools(i18n: I18nManager) -> list[types.Tool]:
     """Get the list of tasks tools for Gemini.
 
+    The declarations only depend on the translations, so they are built once
+    per language (and translations reload) and shared. Callers must not
+    modify the returned list.
+
     Args:
-        i18n: I18n instance for translations.
+        i18n: I18nManager instance for translations.
+
+    Returns:
+        List of Tool objects for tasks operations.
+    """
+    return _build_tasks_tools(i18n, i18n.language, i18n.translations_version)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_tasks_tools(
+    i18n: I18nManager, language: str, translations_version: int
+) -> list[types.Tool]:
+    """Build the tasks tool declarations for a language.
+
+    Args:
+        i18n: I18nManager instance for translations.
+        language: Current language code (cache key).
+        translations_version: I18nManager.translations_version (cache key).
 
     Returns:
         List of Tool objects for tasks operations.
     """
     t = i18n.t
+
+    # Shared by every declaration that targets a specific task list
+    tasklist_id_default = types.Schema(
+        type=types.Type.STRING,
+        description=t("tasks_param_tasklist_id_default"),
+    )
+
     return [
         types.Tool(
             function_declarations=[
@@ -77,10 +108,7 @@ def get_tasks_tools(i18n: I18nManager) -> list[types.Tool]:
                                 type=types.Type.STRING,
                                 description=t("tasks_param_due"),
                             ),
-                            "tasklist_id": types.Schema(
-                                type=types.Type.STRING,
-                                description=t("tasks_param_tasklist_id_default"),
-                            ),
+                            "tasklist_id": tasklist_id_default,
                         },
                         required=["title"],
                     ),
@@ -107,10 +135,7 @@ def get_tasks_tools(i18n: I18nManager) -> list[types.Tool]:
                                 type=types.Type.STRING,
                                 description=t("tasks_param_due_new"),
                             ),
-                            "tasklist_id": types.Schema(
-                                type=types.Type.STRING,
-                                description=t("tasks_param_tasklist_id_default"),
-                            ),
+                            "tasklist_id": tasklist_id_default,
                         },
                         required=["task_id"],
                     ),
@@ -125,10 +150,7 @@ def get_tasks_tools(i18n: I18nManager) -> list[types.Tool]:
                                 type=types.Type.STRING,
                                 description=t("tasks_param_task_id_complete"),
                             ),
-                            "tasklist_id": types.Schema(
-                                type=types.Type.STRING,
-                                description=t("tasks_param_tasklist_id_default"),
-                            ),
+                            "tasklist_id": tasklist_id_default,
                         },
                         required=["task_id"],
                     ),
@@ -143,10 +165,7 @@ def get_tasks_tools(i18n: I18nManager) -> list[types.Tool]:
                                 type=types.Type.STRING,
                                 description=t("tasks_param_task_id_delete"),
                             ),
-                            "tasklist_id": types.Schema(
-                                type=types.Type.STRING,
-                                description=t("tasks_param_tasklist_id_default"),
-                            ),
+                            "tasklist_id": tasklist_id_default,
                         },
                         required=["task_id"],
                     ),
@@ -168,10 +187,17 @@ class TasksToolHandler:
         """
         self.calendar_auth = calendar_auth
         self.i18n = i18n
+        self._t = i18n.t
 
-    def t(self, key: str, **kwargs) -> str:
-        """Get translated string."""
-        return self.i18n.t(key, **kwargs)
+        # Function name -> handler coroutine
+        self._handlers = {
+            "list_task_lists": self._handle_list_task_lists,
+            "list_tasks": self._handle_list_tasks,
+            "create_task": self._handle_create_task,
+            "update_task": self._handle_update_task,
+            "complete_task": self._handle_complete_task,
+            "delete_task": self._handle_delete_task,
+        }
 
     async def handle_function_call(
         self,
@@ -193,26 +219,17 @@ class TasksToolHandler:
         if not self.calendar_auth.is_user_authenticated(user_id):
             return {
                 "error": "not_authenticated",
-                "message": self.t("tasks_not_authenticated"),
+                "message": self._t("tasks_not_authenticated"),
             }
 
+        handler = self._handlers.get(function_name)
+        if handler is None:
+            return {"error": "unknown_function", "message": f"Unknown function: {function_name}"}
+
         try:
-            if function_name == "list_task_lists":
-                return await self._handle_list_task_lists(user_id, function_args)
-            elif function_name == "list_tasks":
-                return await self._handle_list_tasks(user_id, function_args)
-            elif function_name == "create_task":
-                return await self._handle_create_task(user_id, function_args)
-            elif function_name == "update_task":
-                return await self._handle_update_task(user_id, function_args)
-            elif function_name == "complete_task":
-                return await self._handle_complete_task(user_id, function_args)
-            elif function_name == "delete_task":
-                return await self._handle_delete_task(user_id, function_args)
-            else:
-                return {"error": "unknown_function", "message": f"Unknown function: {function_name}"}
+            return await handler(user_id, function_args)
         except Exception as e:
-            return {"error": "api_error", "message": str(e)}
+            return api_error_response(e)
 
     async def _handle_list_task_lists(self, user_id: int, args: dict) -> dict:
         """Handle list_task_lists function call."""
@@ -222,7 +239,7 @@ class TasksToolHandler:
         )
 
         if not task_lists:
-            return {"task_lists": [], "message": self.t("tasks_list_empty")}
+            return {"task_lists": [], "message": self._t("tasks_list_empty")}
 
         return {"task_lists": task_lists, "count": len(task_lists)}
 
@@ -236,7 +253,7 @@ class TasksToolHandler:
         )
 
         if not tasks:
-            return {"tasks": [], "message": self.t("tasks_empty")}
+            return {"tasks": [], "message": self._t("tasks_empty")}
 
         return {"tasks": tasks, "count": len(tasks)}
 
@@ -252,7 +269,7 @@ class TasksToolHandler:
 
         return {
             "success": True,
-            "message": self.t("tasks_created", title=task["title"]),
+            "message": self._t("tasks_created", title=task["title"]),
             "task": task,
         }
 
@@ -269,7 +286,7 @@ class TasksToolHandler:
 
         return {
             "success": True,
-            "message": self.t("tasks_updated", title=task["title"]),
+            "message": self._t("tasks_updated", title=task["title"]),
             "task": task,
         }
 
@@ -283,7 +300,7 @@ class TasksToolHandler:
 
         return {
             "success": True,
-            "message": self.t("tasks_completed", title=task["title"]),
+            "message": self._t("tasks_completed", title=task["title"]),
             "task": task,
         }
 
@@ -297,5 +314,5 @@ class TasksToolHandler:
 
         return {
             "success": True,
-            "message": self.t("tasks_deleted"),
+            "message": self._t("tasks_deleted"),
         }